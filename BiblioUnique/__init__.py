@@ -0,0 +1,140 @@
+"""
+BiblioUnique V2
+Fusion des outils personnels : utilhhd, lowORM, sysSauvegarde
+
+Paquet à chargement paresseux : `from BiblioUnique import Database` n'importe
+que BiblioUnique.lowORM (et ses dépendances légères dates / nombres) ; les
+modules wxPython, PIL et Pythonista ne sont lus qu'à la première utilisation
+d'un de leurs noms.
+
+Sous-modules :
+- lowORM        : Database, AsyncDatabase, puits d'instrumentation
+- dates         : constantes et formatage des dates à la française
+- nombres       : formatage et conversion des nombres à la française
+- feries        : jours fériés, lus dans le CSV ou calculés
+- etat          : VarSetBind, AppState et les singletons vsb / app_state
+- sysSauvegarde : sauvegardeAuto, lister_sauvegardes, restaurer_sauvegarde
+- wxui          : widgets et dialogues wxPython
+- pythonista    : interfaces Pythonista
+- calendrier    : calendrier mensuel en PNG
+"""
+
+"""
+F-Strings avancées :
+- 2 décimales : f"{nombre:.2f}"
+- Séparateur de milliers (français) : f"{format_fr(nombre)}"
+- Exemple : f"Résultat : {format_fr(1234567.89)} €" -> Résultat : 1 234 567,89 €
+
+strftime - Formatage des dates :
+- "%Y" : Année (ex : 2025)
+- "%m" : Mois numérique (01 à 12)
+- "%d" : Jour du mois (01 à 31)
+- "%H" : Heure (00-23)
+- "%M" : Minute (00-59)
+- "%S" : Seconde (00-59)
+- "%A" : Jour de la semaine (ex : lundi)
+- "%B" : Mois en toutes lettres (ex : avril)
+- "%W" : Numéro de semaine (01-53)
+- "%j" : Jour dans l'année (001-366)
+- Pas de format natif pour "trimestre", il faut le calculer :
+  trimestre = (mois - 1) // 3 + 1
+
+Autres rappels utiles :
+- Type dict : {"clé": valeur}
+- Type set : {élément1, élément2}
+- Type list : [élément1, élément2]
+- Conversion rapide :
+    list(mon_set) -> transforme set en liste
+    set(ma_liste) -> transforme liste en set (éléments uniques)
+    dict(liste_de_tuples) -> transforme [("clé", "valeur")] en dict
+
+Astuce bonus :
+- Fusion de dictionnaires : d1 | d2 (Python 3.9+)
+"""
+
+
+import importlib
+
+# Nom public ➜ sous-module qui le définit
+_EMPLACEMENTS = {
+    # lowORM
+    "Database": "lowORM",
+    "AsyncDatabase": "lowORM",
+    "RequetePreparee": "lowORM",
+    "Page": "lowORM",
+    "PROFILS_SQLITE": "lowORM",
+    "PuitsLogger": "lowORM",
+    "PuitsMemoire": "lowORM",
+    "PuitsJsonl": "lowORM",
+    "panneau_requetes_lentes": "lowORM",
+    "safe_where_date": "lowORM",
+    # dates
+    "ensure_date": "dates",
+    "MOIS_FRANCE": "dates",
+    "MOIS_FR_ABR": "dates",
+    "JOURS_FRANCE": "dates",
+    "JOURS_FR_ABR": "dates",
+    "datefr2iso": "dates",
+    "dateFr": "dates",
+    "datesFr": "dates",
+    "objToDateFr": "dates",
+    "validate_date": "dates",
+    "validate_time": "dates",
+    "validate_datetime": "dates",
+    "validate_and_fix_date": "dates",
+    "validate_and_fix_time": "dates",
+    "sys_date": "dates",
+    "from_sql_date": "dates",
+    "ecart_ymd": "dates",
+    "prochainJourSemaine": "dates",
+    "tous_les_jours_du_mois": "dates",
+    "retourneLe1DuMoisAvant": "dates",
+    # nombres
+    "nombreFr": "nombres",
+    "frToNombre": "nombres",
+    "format_euro": "nombres",
+    "format_fr": "nombres",
+    "textoFloat": "nombres",
+    # feries
+    "lire_jours_feries": "feries",
+    "jours_feries_entre": "feries",
+    "jours_feries_annee": "feries",
+    "paques": "feries",
+    # etat
+    "VarSetBind": "etat",
+    "AppState": "etat",
+    "vsb": "etat",
+    "app_state": "etat",
+    # sysSauvegarde
+    "sauvegardeAuto": "sysSauvegarde",
+    "lister_sauvegardes": "sysSauvegarde",
+    "restaurer_sauvegarde": "sysSauvegarde",
+    "raise_mac_app": "sysSauvegarde",
+    # wxui
+    "get_police_luciole": "wxui",
+    "wxSegControl": "wxui",
+    "choixDateForPython": "wxui",
+    "wx_to_datetime": "wxui",
+    "datetime_to_wx": "wxui",
+    # pythonista
+    "dateSelectorAttach": "pythonista",
+    "demander_confirmation": "pythonista",
+    # calendrier
+    "calendar_png_maker": "calendrier",
+}
+
+__all__ = list(_EMPLACEMENTS)
+
+
+def __getattr__(nom: str):
+    """Importe le sous-module au premier accès à l'un de ses noms, puis le garde en cache."""
+    module = _EMPLACEMENTS.get(nom)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+    valeur = getattr(importlib.import_module(f".{module}", __name__), nom)
+    globals()[nom] = valeur
+    return valeur
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EMPLACEMENTS))
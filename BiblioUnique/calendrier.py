@@ -0,0 +1,181 @@
+"""
+Calendrier mensuel en image PNG (PIL importé dans la fonction).
+"""
+
+from .dates import JOURS_FR_ABR, dateFr
+
+# def calendar_png_maker(
+#     anMois, jourAencadre, jourEnRouge, texteMultiligneSouscalendrier
+# ):
+#     """
+#     Génère et enregistre une image PNG contenant un calendrier mensuel adapté aux écrans de smartphone.
+
+#     Chaque jour du mois est correctement positionné selon son jour de semaine réel.
+#     Les jours spécifiés sont surlignés ou encadrés, et un texte explicatif s'affiche sous le calendrier.
+
+#     Args:
+#         anMois (date) : Date (année + mois) utilisée comme base du calendrier.
+#         jourAencadre (list[int]) : Liste des jours (numériques) à encadrer en bleu.
+#         jourEnRouge (list[int]) : Liste des jours (numériques) à afficher en rouge.
+#         texteMultiligneSouscalendrier (str) : Texte multi-ligne à afficher en bas de l’image.
+
+#     Returns:
+#         str : Chemin du fichier PNG généré (ex: "2025_05.png").
+#     """
+#     from PIL import Image, ImageFont, ImageDraw
+#     import calendar
+#     from io import BytesIO
+
+#     largeur, hauteur = 420, 800
+#     cal_img = Image.new("RGB", (largeur, hauteur), "white")
+#     draw = ImageDraw.Draw(cal_img)
+
+#     try:
+#         font = ImageFont.truetype("Luciole-Regular-Italic.ttf", 24)
+#     except IOError:
+#         font = ImageFont.load_default()
+
+#     titre = f"{dateFr(anMois, 'mois')} {anMois.year}"
+#     draw.text((20, 20), titre, font=font, fill="black")
+
+#     cell_w, cell_h = 55, 60
+#     x0, y0 = 20, 70
+
+#     jours_ord = [JOURS_FR_ABR[i] for i in range(1, 8)]
+#     for idx, nom_jour in enumerate(jours_ord):
+#         x = x0 + idx * cell_w
+#         draw.text((x + 10, y0), nom_jour, font=font, fill="black")
+
+#     y0 += cell_h
+
+#     cal = calendar.Calendar(firstweekday=0)
+#     mois_jours = cal.itermonthdays(anMois.year, anMois.month)
+
+#     week = 0
+#     for idx, jour in enumerate(mois_jours):
+#         col = idx % 7
+#         if col == 0 and idx > 0:
+#             week += 1
+#         if jour == 0:
+#             continue
+
+#         x = x0 + col * cell_w
+#         y = y0 + week * cell_h
+#         draw.rectangle([x, y, x + cell_w, y + cell_h], outline="black")
+
+#         fill = "red" if jour in jourEnRouge else "black"
+#         draw.text((x + 5, y + 5), str(jour), font=font, fill=fill)
+
+#         if jour in jourAencadre:
+#             draw.rectangle(
+#                 [x + 2, y + 2, x + cell_w - 2, y + cell_h - 2], outline="blue", width=2
+#             )
+#     try:
+#         font12 = ImageFont.truetype("Luciole-Regular-Italic.ttf", 12)
+#     except IOError:
+#         font12 = ImageFont.load_default()
+
+#     lines = texteMultiligneSouscalendrier.split("\n")
+#     y_text = y0 + (week + 1) * cell_h + 30
+#     for line in lines:
+#         draw.text((20, y_text), line, font=font12, fill="black")
+#         y_text += font12.getbbox(line)[3] + 10
+
+#     nom_fichier = f"{anMois.year}_{dateFr(anMois, 'mois')}.png"
+#     with open(nom_fichier, "wb") as f:
+#         cal_img.save(f, format="PNG")
+
+#     return nom_fichier
+
+
+def calendar_png_maker(
+    anMois, jourAencadre, jourEnRouge, texteMultiligneSouscalendrier
+):
+    from PIL import Image, ImageFont, ImageDraw
+    import calendar
+    import random
+    from io import BytesIO
+
+    largeur, hauteur = 420, 800
+    cal_img = Image.new("RGB", (largeur, hauteur), "#bddac0")
+    draw = ImageDraw.Draw(cal_img)
+
+    try:
+        font_jour = ImageFont.truetype("Luciole-Regular-Italic.ttf", 24)
+        font_titre = ImageFont.truetype("Luciole-Regular-Italic.ttf", 40)
+        font_calnum = ImageFont.truetype("Luciole-Regular-Italic.ttf", 26)
+        font12 = ImageFont.truetype("Luciole-Regular-Italic.ttf", 12)
+    except IOError:
+        font_jour = font_titre = font_calnum = font12 = ImageFont.load_default()
+
+    # Titre centré
+    titre = f"{dateFr(anMois, 'mois')} {anMois.year}"
+    w = draw.textlength(titre, font=font_titre)
+    draw.text(((largeur - w) // 2, 20), titre, font=font_titre, fill="black")
+
+    # Entêtes des jours
+    cell_w, cell_h = 55, 60
+    x0, y0 = 20, 90
+    jours_ord = [JOURS_FR_ABR[i] for i in range(1, 8)]
+    for idx, nom_jour in enumerate(jours_ord):
+        x = x0 + idx * cell_w
+        draw.text((x + 5, y0), nom_jour, font=font_jour, fill="black")
+
+    y0 += cell_h
+
+    cal = calendar.Calendar(firstweekday=0)
+    mois_jours = list(cal.itermonthdays(anMois.year, anMois.month))
+
+    semaine = 0
+    for idx, jour in enumerate(mois_jours):
+        col = idx % 7
+        if idx > 0 and col == 0:
+            semaine += 1
+        if jour == 0:
+            continue
+
+        x = x0 + col * cell_w
+        y = y0 + semaine * cell_h
+        txt = str(jour)
+        fill = "red" if jour in jourEnRouge else "black"
+        draw.text((x + 10, y + 8), txt, font=font_calnum, fill=fill)
+
+        if jour in jourAencadre:
+            # Détection fine du centre du texte
+            txt = str(jour)
+            bbox = draw.textbbox((0, 0), txt, font=font_calnum)
+            w_txt = bbox[2] - bbox[0]
+            h_txt = bbox[3] - bbox[1]
+            decalage_x = -4  # vers la gauche (− = gauche, + = droite)
+            decalage_y = -9  # vers le haut (− = haut, + = bas)
+
+            cx = x + (cell_w // 2) + decalage_x
+            cy = y + (cell_h // 2) + decalage_y
+
+            base_r = max(w_txt, h_txt) // 2 + 10
+
+            for _ in range(5):
+                r = base_r + random.randint(-2, 2)
+                dx = random.randint(-2, 2)
+                dy = random.randint(-2, 2)
+                draw.ellipse(
+                    [
+                        (cx - r + dx, cy - r + dy),
+                        (cx + r + dx, cy + r + dy),
+                    ],
+                    outline="red",
+                    width=1,
+                )
+
+    # Texte multi-ligne
+    lines = texteMultiligneSouscalendrier.split("\n")
+    y_text = y0 + (semaine + 1) * cell_h + 20
+    for line in lines:
+        draw.text((20, y_text), line, font=font12, fill="black")
+        y_text += font12.getbbox(line)[3] + 10
+
+    nom_fichier = f"{anMois.year}_{dateFr(anMois, 'mois')}.png"
+    with open(nom_fichier, "wb") as f:
+        cal_img.save(f, format="PNG")
+
+    return nom_fichier
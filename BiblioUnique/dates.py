@@ -0,0 +1,658 @@
+"""
+Dates à la française : constantes, formatage, conversion et calculs.
+"""
+
+import calendar
+from datetime import datetime, date, timedelta
+from functools import wraps
+from typing import Optional
+
+
+def _est_date(annotation) -> bool:
+    """True si l'annotation désigne date (date, Optional[date], "date"...)."""
+    if annotation is date:
+        return True
+    if isinstance(annotation, str):
+        return "date" in annotation.replace("datetime", "")
+    return date in getattr(annotation, "__args__", ())
+
+
+def _contient_datetime(obj) -> bool:
+    """Recherche récursive d'un datetime, sans rien allouer."""
+    if isinstance(obj, datetime):
+        return True
+    if isinstance(obj, (list, tuple)):
+        for x in obj:
+            if _contient_datetime(x):
+                return True
+    elif isinstance(obj, dict):
+        for x in obj.values():
+            if _contient_datetime(x):
+                return True
+    return False
+
+
+def _convertir_recursif(obj):
+    if isinstance(obj, datetime):
+        return obj.date()
+    elif isinstance(obj, (list, tuple)):
+        return type(obj)(_convertir_recursif(x) for x in obj)
+    elif isinstance(obj, dict):
+        return {k: _convertir_recursif(v) for k, v in obj.items()}
+    else:
+        return obj
+
+
+def ensure_date(func=None, *, parametres: Optional[tuple] = None):
+    """
+    Décorateur : convertit les datetime en date avant l'appel.
+    exemples :
+        @ensure_date                          # paramètres annotés date
+        @ensure_date(parametres=("debut",))   # paramètres choisis
+
+    Les paramètres visés sont, dans l'ordre :
+    - ceux de `parametres` ;
+    - sinon ceux annotés date (ou Optional[date]), lus une seule fois à la
+      décoration dans le code de la fonction ;
+    - sinon tous les arguments, parcourus récursivement (listes, tuples,
+      dicts) comme l'ancienne version.
+
+    Quand aucun argument visé n'est un datetime, la fonction est appelée
+    directement avec les mêmes args / kwargs, sans rien reconstruire.
+    """
+    if func is None:
+        return lambda f: ensure_date(f, parametres=parametres)
+
+    # Signature lue sur la fonction d'origine si func est déjà décorée (wraps)
+    origine = func
+    while hasattr(origine, "__wrapped__"):
+        origine = origine.__wrapped__
+    code = origine.__code__
+    noms_positionnels = code.co_varnames[: code.co_argcount]
+    noms_nommes = code.co_varnames[
+        code.co_argcount : code.co_argcount + code.co_kwonlyargcount
+    ]
+    if parametres is None:
+        annotations = getattr(func, "__annotations__", {})
+        parametres = tuple(
+            nom
+            for nom in noms_positionnels + noms_nommes
+            if _est_date(annotations.get(nom))
+        )
+    else:
+        inconnus = set(parametres) - set(noms_positionnels + noms_nommes)
+        if inconnus:
+            raise ValueError(
+                f"{func.__name__} n'a pas de paramètre {', '.join(sorted(inconnus))}"
+            )
+
+    if not parametres:
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for arg in args:
+                if _contient_datetime(arg):
+                    break
+            else:
+                if not _contient_datetime(kwargs):
+                    return func(*args, **kwargs)
+            new_args = tuple(_convertir_recursif(arg) for arg in args)
+            new_kwargs = {k: _convertir_recursif(v) for k, v in kwargs.items()}
+            return func(*new_args, **new_kwargs)
+
+        return wrapper
+
+    # (nom, position) de chaque paramètre visé ; position None si nommé seulement
+    cibles = tuple(
+        (nom, noms_positionnels.index(nom) if nom in noms_positionnels else None)
+        for nom in parametres
+    )
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        nb_args = len(args)
+        for nom, position in cibles:
+            if position is not None and position < nb_args:
+                if isinstance(args[position], datetime):
+                    break
+            elif isinstance(kwargs.get(nom), datetime):
+                break
+        else:
+            return func(*args, **kwargs)
+
+        args = list(args)
+        for nom, position in cibles:
+            if position is not None and position < nb_args:
+                if isinstance(args[position], datetime):
+                    args[position] = args[position].date()
+            elif isinstance(kwargs.get(nom), datetime):
+                kwargs[nom] = kwargs[nom].date()
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+# def ensure_date(func):
+#     """
+#     Décorateur qui convertit les datetime en date pour les paramètres de la fonction.
+#     """
+
+#     @wraps(func)
+#     def wrapper(*args, **kwargs):
+#         # Convertir les args
+#         new_args = []
+#         for arg in args:
+#             if isinstance(arg, datetime):
+#                 new_args.append(arg.date())
+#             else:
+#                 new_args.append(arg)
+
+#         # Convertir les kwargs
+#         new_kwargs = {}
+#         for key, value in kwargs.items():
+#             if isinstance(value, datetime):
+#                 new_kwargs[key] = value.date()
+#             else:
+#                 new_kwargs[key] = value
+
+#         return func(*new_args, **new_kwargs)
+
+#     return wrapper
+
+
+# === Constantes ===
+MOIS_FRANCE = {
+    1: "Janvier",
+    2: "Février",
+    3: "Mars",
+    4: "Avril",
+    5: "Mai",
+    6: "Juin",
+    7: "Juillet",
+    8: "Août",
+    9: "Septembre",
+    10: "Octobre",
+    11: "Novembre",
+    12: "Décembre",
+}
+MOIS_FR_ABR = {
+    1: "jan",
+    2: "fév",
+    3: "mar",
+    4: "avr",
+    5: "mai",
+    6: "juin",
+    7: "juil",
+    8: "aoû",
+    9: "sep",
+    10: "oct",
+    11: "nov",
+    12: "déc",
+}
+JOURS_FRANCE = {
+    1: "Lundi",
+    2: "Mardi",
+    3: "Mercredi",
+    4: "Jeudi",
+    5: "Vendredi",
+    6: "Samedi",
+    7: "Dimanche",
+}
+JOURS_FR_ABR = {
+    1: "lun",
+    2: "mar",
+    3: "mer",
+    4: "jeu",
+    5: "ven",
+    6: "sam",
+    7: "dim",
+}
+
+
+def datefr2iso(text: str) -> Optional[str]:
+    """
+    Convertit une date au format français en format ISO (YYYY-MM-DD).
+
+    Supporte les formats suivants :
+    - "lun. 21 jan. 2025" (abr)
+    - "lundi 21 janvier 2025" (long)
+    - "janvier" (mois)
+    - "jan" (moisAbr)
+    - "2025" (an)
+
+    Retourne None si le format n'est pas reconnu.
+    """
+    try:
+        # Extraire les éléments de base
+        elements = text.split()
+
+        # Cas "2025" (année seule)
+        if len(elements) == 1 and elements[0].isdigit():
+            return f"{elements[0]}-01-01"
+
+        # Cas "janvier" ou "jan"
+        if len(elements) == 1:
+            mois = elements[0].lower()
+            for num, moisAbr in MOIS_FR_ABR.items():
+                if moisAbr.startswith(mois):
+                    return f"2025-{num:02d}-01"
+            for num, moisLong in MOIS_FRANCE.items():
+                if moisLong.lower().startswith(mois):
+                    return f"2025-{num:02d}-01"
+            return None
+
+        # Cas "lun. 21 jan. 2025" ou "lundi 21 janvier 2025"
+        if len(elements) == 4:
+            # Extraire les éléments
+            jourAbr = elements[0].lower()
+            jour = int(elements[1])
+            mois = elements[2].lower()
+            annee = int(elements[3])
+
+            # Vérifier le jour
+            if jour < 1 or jour > 31:
+                return None
+
+            # Trouver le numéro du mois
+            for num, moisAbr in MOIS_FR_ABR.items():
+                if moisAbr.startswith(mois):
+                    return f"{annee:04d}-{num:02d}-{jour:02d}"
+            for num, moisLong in MOIS_FRANCE.items():
+                if moisLong.lower().startswith(mois):
+                    return f"{annee:04d}-{num:02d}-{jour:02d}"
+            return None
+
+        return None
+    except (ValueError, IndexError):
+        return None
+
+
+@ensure_date
+def dateFr(d: date = None, style: str = "abr") -> str:
+    """
+    Retourne une date formatée à la française sans locale.
+
+    style :
+      - "abr"       ➜ lun 21 jan 2025
+      - "long"      ➜ lundi 21 janvier 2025
+      - "jour"      ➜ lundi
+      - "jourAbr"   ➜ lun.
+      - "mois"      ➜ janvier
+      - "moisAbr"   ➜ jan.
+      - "an"        ➜ 2025
+      - "iso"      ➜ 2025-01-21
+    """
+    if d is None:
+        d = date.today()
+    j = d.isoweekday()
+    m = d.month
+
+    if style == "jour":
+        return JOURS_FRANCE[j]
+    elif style == "jourAbr":
+        return JOURS_FR_ABR[j]
+    elif style == "mois":
+        return MOIS_FRANCE[m]
+    elif style == "moisAbr":
+        return MOIS_FR_ABR[m]
+    elif style == "an":
+        return str(d.year)
+    elif style == "iso":
+        return f"{d.year}-{m:02d}-{d.day:02d}"
+    elif style == "long":
+        jour = JOURS_FRANCE[j]
+        mois = MOIS_FRANCE[m]
+        return f"{jour} {d.day:02d} {mois} {d.year}"
+    else:
+        jour = JOURS_FR_ABR[j]
+        mois = MOIS_FR_ABR[m]
+        return f"{jour} {d.day:02d} {mois} {d.year}"
+
+
+# Tables de correspondance de datesFr, indexées par isoweekday / numéro de mois
+_T_JOURS = (None, *(JOURS_FRANCE[i] for i in range(1, 8)))
+_T_JOURS_ABR = (None, *(JOURS_FR_ABR[i] for i in range(1, 8)))
+_T_MOIS = (None, *(MOIS_FRANCE[i] for i in range(1, 13)))
+_T_MOIS_ABR = (None, *(MOIS_FR_ABR[i] for i in range(1, 13)))
+_T_02D = tuple(f"{i:02d}" for i in range(32))
+
+
+def _formateur_date(style: str):
+    """Fonction (année, mois, jour, isoweekday) -> texte, identique à dateFr(d, style)."""
+    if style == "jour":
+        return lambda a, m, j, js: _T_JOURS[js]
+    elif style == "jourAbr":
+        return lambda a, m, j, js: _T_JOURS_ABR[js]
+    elif style == "mois":
+        return lambda a, m, j, js: _T_MOIS[m]
+    elif style == "moisAbr":
+        return lambda a, m, j, js: _T_MOIS_ABR[m]
+    elif style == "an":
+        return lambda a, m, j, js: str(a)
+    elif style == "iso":
+        return lambda a, m, j, js: f"{a}-{_T_02D[m]}-{_T_02D[j]}"
+    elif style == "long":
+        return lambda a, m, j, js: f"{_T_JOURS[js]} {_T_02D[j]} {_T_MOIS[m]} {a}"
+    else:
+        return (
+            lambda a, m, j, js: f"{_T_JOURS_ABR[js]} {_T_02D[j]} {_T_MOIS_ABR[m]} {a}"
+        )
+
+
+def datesFr(dates, style: str = "abr", vide: Optional[str] = None) -> list:
+    """
+    Version par lots de dateFr : formate une séquence de date / datetime ou un
+    tableau NumPy datetime64 (1 dimension) avec le même `style`.
+    exemple : datesFr(df["date"].to_numpy(), "long")
+
+    Chaque texte est identique à dateFr(d, style) : comme dateFr, None (et NaT)
+    donnent la date du jour, sauf si `vide` est fourni, ex. vide="" pour
+    laisser les dates manquantes en blanc.
+    Les noms de jours et de mois viennent de tables précalculées, et une date
+    déjà rencontrée dans le lot n'est formatée qu'une fois.
+
+    Returns:
+        list: textes dans l'ordre des dates
+    """
+    formater = _formateur_date(style)
+    if vide is None:
+        aujourdhui = date.today()
+        vide = formater(
+            aujourdhui.year, aujourdhui.month, aujourdhui.day, aujourdhui.isoweekday()
+        )
+
+    dtype = getattr(dates, "dtype", None)
+    if dtype is not None and dtype.kind == "M":
+        import numpy as np
+
+        jours = np.asarray(dates).astype("datetime64[D]").ravel()
+        debuts_mois = jours.astype("datetime64[M]")
+        annees = (jours.astype("datetime64[Y]").astype("int64") + 1970).tolist()
+        mois = (debuts_mois.astype("int64") % 12 + 1).tolist()
+        jours_mois = ((jours - debuts_mois).astype("int64") + 1).tolist()
+        # 1970-01-01 était un jeudi (isoweekday 4)
+        jours_semaine = ((jours.astype("int64") + 3) % 7 + 1).tolist()
+        return [
+            vide if nat else formater(a, m, j, js)
+            for nat, a, m, j, js in zip(
+                np.isnat(jours).tolist(), annees, mois, jours_mois, jours_semaine
+            )
+        ]
+
+    deja_vus = {None: vide}
+    resultats = []
+    for d in dates:
+        texte = deja_vus.get(d)
+        if texte is None:
+            texte = deja_vus[d] = formater(d.year, d.month, d.day, d.isoweekday())
+        resultats.append(texte)
+    return resultats
+
+
+def objToDateFr(date_str: str) -> Optional[date]:
+    """
+    Convertit une chaîne de date française en objet date.
+
+    Supporte les formats suivants :
+    - "lun 21 jan 2025" (abr)
+    - "lundi 21 janvier 2025" (long)
+    - "janvier" (mois)
+    - "jan" (moisAbr)
+    - "2025" (an)
+    - "2025-01-21" (iso)
+
+    Retourne None si le format n'est pas reconnu.
+    """
+    try:
+        # Gérer le format ISO (YYYY-MM-DD)
+        if date_str.count("-") == 2:  # Format ISO
+            try:
+                return date.fromisoformat(date_str)
+            except ValueError:
+                pass
+
+        # Gérer le format année seule
+        if len(date_str) == 4 and date_str.isdigit():
+            return date(int(date_str), 1, 1)
+
+        # Extraire les éléments de base pour les autres formats
+        elements = date_str.split()
+
+        # Cas "2025" (année seule)
+        if len(elements) == 1 and elements[0].isdigit():
+            return date(int(elements[0]), 1, 1)
+
+        # Cas "janvier" ou "jan"
+        if len(elements) == 1:
+            mois = elements[0].lower()
+            for num, moisAbr in MOIS_FR_ABR.items():
+                if moisAbr.lower().startswith(mois):
+                    return date(datetime.now().year, num, 1)
+            for num, moisLong in MOIS_FRANCE.items():
+                if moisLong.lower().startswith(mois):
+                    return date(datetime.now().year, num, 1)
+            return None
+
+        # Cas "lun. 21 jan. 2025" ou "lundi 21 janvier 2025"
+        if len(elements) == 4:
+            try:
+                jour = int(elements[1])
+                mois = elements[2].lower()
+                annee = int(elements[3])
+
+                # Vérifier le jour
+                if jour < 1 or jour > 31:
+                    return None
+
+                # Trouver le numéro du mois
+                for num, moisAbr in MOIS_FR_ABR.items():
+                    if moisAbr.lower().startswith(mois):
+                        return date(annee, num, jour)
+                for num, moisLong in MOIS_FRANCE.items():
+                    if moisLong.lower().startswith(mois):
+                        return date(annee, num, jour)
+                return None
+
+            except (ValueError, IndexError):
+                return None
+
+        return None
+    except (ValueError, IndexError):
+        return None
+
+
+def validate_date(jour: int, mois: int, annee: int) -> bool:
+    """Valider une date"""
+    try:
+        date(annee, mois, jour)  # Ordre correct : année, mois, jour
+        return True
+    except ValueError:
+        return False
+
+
+def validate_time(heure: int, minute: int, seconde: int) -> bool:
+    """Valider une heure"""
+    try:
+        datetime(
+            2023, 1, 1, heure, minute, seconde
+        )  # Ordre correct : année, mois, jour, heure, minute, seconde
+        return True
+    except ValueError:
+        return False
+
+
+def validate_datetime(
+    jour: int, mois: int, annee: int, heure: int, minute: int, seconde: int
+) -> bool:
+    """Valider une date et une heure"""
+    try:
+        datetime(
+            annee, mois, jour, heure, minute, seconde
+        )  # Ordre correct : année, mois, jour, heure, minute, seconde
+        return True
+    except ValueError:
+        return False
+
+
+def validate_and_fix_date(
+    jour: int | None, mois: int | None, annee: int | None
+) -> tuple[int, int, int]:
+    """Valide et corrige une date si nécessaire"""
+    now = date.today()
+    jour = jour or now.day
+    mois = mois or now.month
+    annee = annee or now.year
+
+    if not validate_date(jour, mois, annee):
+        return now.day, now.month, now.year
+    return jour, mois, annee
+
+
+def validate_and_fix_time(
+    heure: int | None, minute: int | None, seconde: int | None
+) -> tuple[int, int, int]:
+    """Valide et corrige une heure si nécessaire"""
+    now = datetime.now()
+    heure = heure or now.hour
+    minute = minute or now.minute
+    seconde = seconde or now.second
+
+    if not validate_time(heure, minute, seconde):
+        return now.hour, now.minute, now.second
+    return heure, minute, seconde
+
+
+def sys_date(tdate: datetime) -> Optional[str]:
+    """
+    Convertit un objet datetime en chaîne au format 'YYYY-MM-DD'.
+
+    - Retourne None en cas d'erreur ou si l'entrée est invalide.
+    """
+    try:
+        return tdate.strftime("%Y-%m-%d")
+    except:
+        return None
+
+
+def from_sql_date(s: str) -> Optional[datetime]:
+    """
+    Convertit une chaîne de type 'YYYY-MM-DD' en objet datetime.
+
+    - Retourne None si la chaîne est mal formée ou vide.
+    """
+    try:
+        return datetime.strptime(s, "%Y-%m-%d")
+    except (ValueError, TypeError):
+        return None
+
+
+@ensure_date
+def ecart_ymd(date1: date, date2: date) -> tuple[int, int, int]:
+    """
+    Retourne l'écart entre deux dates en années, mois et jours.
+    """
+    if date1 > date2:
+        date1, date2 = date2, date1
+
+    y = date2.year - date1.year
+    m = date2.month - date1.month
+    d = date2.day - date1.day
+
+    if d < 0:
+        m -= 1
+        # jours du mois précédent
+        prev_month = date2.replace(day=1) - timedelta(days=1)
+        d += prev_month.day
+
+    if m < 0:
+        y -= 1
+        m += 12
+
+    return y, m, d
+
+
+def prochainJourSemaine(*jours_souhaités, ref=None):
+    """
+    Retourne les prochaines dates correspondant aux jours demandés.
+
+    - Sans argument : retourne la date du même jour la semaine suivante.
+    - Avec un ou plusieurs jours (ex: "lundi", "mardi") : retourne la prochaine occurrence de chacun.
+    - Paramètre ref :
+        "2sem"  ➜ semaine +1 (soit +14 jours)
+        "3sem"  ➜ semaine +2 (soit +21 jours)
+        "1mois" ➜ mois +1 (soit +30 jours)
+
+    Retour : liste de datetime
+    """
+    noms_jours = {
+        "lundi": 0,
+        "mardi": 1,
+        "mercredi": 2,
+        "jeudi": 3,
+        "vendredi": 4,
+        "samedi": 5,
+        "dimanche": 6,
+    }
+
+    decalages = {
+        "2sem": 7,
+        "3sem": 14,
+        "1mois": 23,
+    }
+
+    aujourd_hui = date.today()
+
+    if not jours_souhaités:
+        jours_souhaités = [dateFr(aujourd_hui, "jour")]
+
+    resultats = []
+    for nom in jours_souhaités:
+        cible = noms_jours[nom.lower()]
+        ecart = (cible - aujourd_hui.weekday() + 7) % 7
+        ecart = ecart or 7  # éviter aujourd’hui
+        ecart += decalages.get(ref, 0)
+        date_prochaine = aujourd_hui + timedelta(days=ecart)
+        resultats.append(date_prochaine)
+
+    resultats.sort()
+    return resultats
+
+
+def tous_les_jours_du_mois(mois: date):
+    """
+    Retourne tous les jours d'un mois sous forme de liste d'objets date.
+
+    Args:
+        mois (date): Date quelconque du mois (année et mois seront utilisés)
+
+    Returns:
+        list: Liste des dates pour chaque jour du mois
+    """
+    annee = mois.year
+    mois_num = mois.month
+
+    # calendar.monthrange retourne (jour de la semaine du premier jour, nombre de jours dans le mois)
+    _, nb_jours = calendar.monthrange(annee, mois_num)
+
+    return [date(annee, mois_num, jour) for jour in range(1, nb_jours + 1)]
+
+
+def retourneLe1DuMoisAvant(d: date) -> date:
+    """
+    Retourne le 1er du mois précédent
+
+    Args:
+        d (date): Date quelconque
+
+    Returns:
+        date: 1er du mois précédent
+    """
+    if d.month == 1:
+        return date(d.year - 1, 12, 1)
+    return date(d.year, d.month - 1, 1)
+
+
+# === Bas de fichier / divers ===
+if __name__ == "__main__":
+    print(retourneLe1DuMoisAvant(date.today()))
+    print(retourneLe1DuMoisAvant(date(2025, 1, 1)))
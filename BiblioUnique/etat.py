@@ -0,0 +1,99 @@
+"""
+Module pour gérer l'état global de l'application
+"""
+
+
+class VarSetBind:
+    def __init__(self):
+        self._state = {}
+        self._observers = {}
+
+    def set(self, key, value):
+        self._state[key] = value
+        for cb in self._observers.get(key, []):
+            cb(value)
+
+    def get(self, key, default=None):
+        return self._state.get(key, default)
+
+    def bind_label(self, key, label):
+        def update_label(val):
+            label.text = str(val)
+
+        self._observers.setdefault(key, []).append(update_label)
+        label.text = str(self.get(key))
+
+    def bind_field(self, key, field):
+        def update_field(val):
+            field.text = str(val)
+
+        def on_edit(sender):
+            self.set(key, int(sender.text))
+
+        self._observers.setdefault(key, []).append(update_field)
+        field.action = on_edit
+        field.text = str(self.get(key))
+
+    def link(self, key_target, keys_sources, compute_fn):
+        def update(_=None):
+            vals = [self.get(k) for k in keys_sources]
+            self.set(key_target, compute_fn(*vals))
+
+        for k in keys_sources:
+            self._observers.setdefault(k, []).append(update)
+        update()
+
+
+class AppState:
+    _instance = None
+
+    @staticmethod
+    def get_instance():
+        """Méthode statique pour obtenir l'instance unique"""
+        if AppState._instance is None:
+            AppState._instance = AppState()
+        return AppState._instance
+
+    def __init__(self):
+        """Initialisation de l'état"""
+        self._state = {"nom": "", "message": ""}
+        self._observers = {}
+
+    def set(self, key, value):
+        """Mettre à jour une valeur et notifie les observateurs"""
+        self._state[key] = value
+        if key in self._observers:
+            for callback in self._observers[key]:
+                callback(value)
+
+    def get(self, key, default=None):
+        """Obtenir une valeur avec une valeur par défaut"""
+        return self._state.get(key, default)
+
+    def subscribe(self, key, callback):
+        """S'abonner aux changements d'une clé"""
+        if key not in self._observers:
+            self._observers[key] = []
+        self._observers[key].append(callback)
+
+    def unsubscribe(self, key, callback):
+        """Se désabonner des changements d'une clé"""
+        if key in self._observers:
+            self._observers[key].remove(callback)
+            if not self._observers[key]:
+                del self._observers[key]
+
+
+# Singletons construits au premier accès (BiblioUnique.vsb, from BiblioUnique
+# import app_state) et non à l'import du module
+_SINGLETONS = {
+    "vsb": VarSetBind,
+    "app_state": AppState.get_instance,
+}
+
+
+def __getattr__(nom: str):
+    if nom in _SINGLETONS:
+        valeur = globals()[nom] = _SINGLETONS[nom]()
+        return valeur
+    raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
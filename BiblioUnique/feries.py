@@ -0,0 +1,198 @@
+"""
+Jours fériés de France métropolitaine : lus dans jours_feries_metropole.csv
+ou calculés (dates fixes + fêtes mobiles dérivées de Pâques).
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Literal
+
+from .dates import ensure_date
+
+FICHIER_FERIES = "jours_feries_metropole.csv"
+
+# Index du fichier, relu seulement si son mtime ou sa taille change :
+# {"cle": (chemin, mtime_ns, taille), "mois": {(annee, mois): [dates]},
+#  "dates": [triées], "annees": {années présentes dans le fichier}}
+_INDEX = {"cle": None, "mois": {}, "dates": [], "annees": frozenset()}
+_VERROU = threading.Lock()
+
+
+def _index_feries(chemin: str = FICHIER_FERIES) -> dict:
+    """
+    Retourne l'index des jours fériés du fichier, construit à la première
+    lecture puis réutilisé tant que le fichier n'a pas été modifié.
+    Lève FileNotFoundError si le fichier n'existe pas.
+    """
+    import csv
+    import os
+
+    infos = os.stat(chemin)
+    cle = (os.path.abspath(chemin), infos.st_mtime_ns, infos.st_size)
+    with _VERROU:
+        if _INDEX["cle"] == cle:
+            return _INDEX
+
+        mois = {}
+        with open(chemin, "r", encoding="utf-8") as f:
+            for ligne in csv.DictReader(f):
+                # Vérifier que la ligne contient une date valide
+                if "date" in ligne and ligne["date"]:
+                    try:
+                        date_ferie = date.fromisoformat(ligne["date"])
+                    except ValueError:
+                        print(f"Date invalide dans le fichier: {ligne['date']}")
+                        continue
+                    mois.setdefault((date_ferie.year, date_ferie.month), []).append(
+                        date_ferie
+                    )
+        for dates in mois.values():
+            dates.sort()
+        _INDEX["mois"] = mois
+        _INDEX["dates"] = sorted(d for dates in mois.values() for d in dates)
+        _INDEX["annees"] = frozenset(annee for annee, _ in mois)
+        _INDEX["cle"] = cle
+        return _INDEX
+
+
+@lru_cache(maxsize=None)
+def paques(annee: int) -> date:
+    """Dimanche de Pâques (calendrier grégorien, algorithme de Meeus / Jones / Butcher)."""
+    a = annee % 19
+    b, c = divmod(annee, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    mois, jour = divmod(h + l - 7 * m + 114, 31)
+    return date(annee, mois, jour + 1)
+
+
+@lru_cache(maxsize=256)
+def _feries_calcules(annee: int) -> tuple:
+    """((date, nom), ...) triés, pour une année ; mémorisé par année."""
+    p = paques(annee)
+    feries = [
+        (date(annee, 1, 1), "1er janvier"),
+        (p + timedelta(days=1), "Lundi de Pâques"),
+        (date(annee, 5, 1), "1er mai"),
+        (date(annee, 5, 8), "8 mai"),
+        (p + timedelta(days=39), "Ascension"),
+        (p + timedelta(days=50), "Lundi de Pentecôte"),
+        (date(annee, 7, 14), "14 juillet"),
+        (date(annee, 8, 15), "Assomption"),
+        (date(annee, 11, 1), "Toussaint"),
+        (date(annee, 11, 11), "11 novembre"),
+        (date(annee, 12, 25), "Jour de Noël"),
+    ]
+    return tuple(sorted(feries))
+
+
+@lru_cache(maxsize=256)
+def _mois_calcules(annee: int) -> dict:
+    mois = {}
+    for d, _ in _feries_calcules(annee):
+        mois.setdefault(d.month, []).append(d)
+    return {m: tuple(dates) for m, dates in mois.items()}
+
+
+def jours_feries_annee(annee: int) -> dict:
+    """
+    Jours fériés calculés de l'année, sans fichier : {date: nom}, triés.
+    Calendrier en vigueur depuis 1982 (retour du 8 mai).
+    exemple : jours_feries_annee(2025)[date(2025, 6, 9)] ➜ "Lundi de Pentecôte"
+    """
+    return dict(_feries_calcules(annee))
+
+
+def _source_csv(source: str) -> bool:
+    """True si le fichier doit être lu, False pour le calcul."""
+    import os
+
+    if source not in ("auto", "csv", "calcul"):
+        raise ValueError(f"source inconnue : {source!r} (auto, csv ou calcul)")
+    if source == "auto":
+        return os.path.exists(FICHIER_FERIES)
+    return source == "csv"
+
+
+def lire_jours_feries(moisan: date, source: Literal["auto", "csv", "calcul"] = "auto"):
+    """
+    Lit les jours fériés du mois.
+
+    source :
+      - "auto"   ➜ le fichier CSV s'il existe et couvre l'année, sinon le calcul
+      - "csv"    ➜ jours_feries_metropole.csv uniquement ([] s'il manque)
+      - "calcul" ➜ jours_feries_annee(), sans aucune lecture de fichier
+
+    Le fichier n'est analysé qu'une fois (puis à chaque modification) ;
+    les appels suivants sont une simple recherche par (année, mois).
+
+    Args:
+        moisan (date): Date du mois à analyser
+
+    Returns:
+        list: Liste des dates complètes des jours fériés
+    """
+    calcul = list(_mois_calcules(moisan.year).get(moisan.month, ()))
+    if not _source_csv(source):
+        return calcul
+    try:
+        index = _index_feries()
+    except FileNotFoundError:
+        print(f"Le fichier {FICHIER_FERIES} n'existe pas")
+        return calcul if source == "auto" else []
+    except Exception as e:
+        print(f"Erreur lors de la lecture du fichier jours_feries: {str(e)}")
+        return calcul if source == "auto" else []
+    if source == "auto" and moisan.year not in index["annees"]:
+        return calcul
+    return list(index["mois"].get((moisan.year, moisan.month), ()))
+
+
+@ensure_date
+def jours_feries_entre(
+    debut: date, fin: date, source: Literal["auto", "csv", "calcul"] = "auto"
+) -> list:
+    """
+    Jours fériés compris entre debut et fin (bornes incluses), triés.
+    exemple : jours_feries_entre(date(2025, 1, 1), date(2025, 12, 31))
+    source : comme lire_jours_feries
+
+    En "auto", les années absentes du fichier sont complétées par le calcul.
+
+    Returns:
+        list: Liste de dates (vide si le fichier requis est absent ou illisible)
+    """
+
+    def calcul(annees):
+        return [
+            d
+            for annee in annees
+            for d, _ in _feries_calcules(annee)
+            if debut <= d <= fin
+        ]
+
+    annees = range(debut.year, fin.year + 1)
+    if not _source_csv(source):
+        return calcul(annees)
+    try:
+        index = _index_feries()
+    except FileNotFoundError:
+        print(f"Le fichier {FICHIER_FERIES} n'existe pas")
+        return calcul(annees) if source == "auto" else []
+    except Exception as e:
+        print(f"Erreur lors de la lecture du fichier jours_feries: {str(e)}")
+        return calcul(annees) if source == "auto" else []
+    dates = index["dates"]
+    dates = dates[bisect_left(dates, debut) : bisect_right(dates, fin)]
+    if source == "auto":
+        manquantes = [a for a in annees if a not in index["annees"]]
+        if manquantes:
+            dates = sorted(dates + calcul(manquantes))
+    return dates
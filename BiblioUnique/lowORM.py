@@ -0,0 +1,2300 @@
+"""
+lowORM : accès SQLite (Database, AsyncDatabase) et outils associés.
+"""
+
+import atexit
+import base64
+import json
+import logging
+import queue
+import re
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Literal, NamedTuple, Optional, Union
+
+from .dates import objToDateFr
+
+
+class _PoolConnexions:
+    """
+    Pool thread-safe de connexions SQLite persistantes.
+
+    Les connexions sont ouvertes à la demande (au plus `taille`), prêtées le
+    temps d'un appel puis rendues au pool au lieu d'être fermées.
+    """
+
+    def __init__(self, ouvrir, taille: int, delai: Optional[float] = None):
+        self._ouvrir = ouvrir
+        self._taille = taille
+        self._delai = delai
+        self._libres = []
+        self._nb_ouvertes = 0
+        self._ferme = False
+        self._condition = threading.Condition()
+        self._emprunteurs = {}  # connexion prêtée -> thread qui l'a prise
+
+    def acquerir(self) -> sqlite3.Connection:
+        """Prête une connexion libre, en ouvre une nouvelle ou attend qu'une se libère."""
+        with self._condition:
+            while True:
+                if self._ferme:
+                    raise sqlite3.ProgrammingError("Le pool de connexions est fermé")
+                if self._libres:
+                    conn = self._libres.pop()
+                    self._emprunteurs[conn] = threading.get_ident()
+                    return conn
+                if self._nb_ouvertes < self._taille:
+                    self._nb_ouvertes += 1
+                    break
+                # Tout est prêté à ce thread : attendre ne libérerait rien
+                if len(self._emprunteurs) == self._nb_ouvertes and all(
+                    t == threading.get_ident() for t in self._emprunteurs.values()
+                ):
+                    raise sqlite3.OperationalError(
+                        "Appel imbriqué : toutes les connexions du pool sont déjà "
+                        "prêtées à ce thread (ex. écriture dans une boucle "
+                        "select_iter) ; augmenter taille_pool"
+                    )
+                if not self._condition.wait(self._delai):
+                    raise sqlite3.OperationalError(
+                        "Aucune connexion libre dans le pool (délai dépassé)"
+                    )
+        try:
+            conn = self._ouvrir()
+        except Exception:
+            with self._condition:
+                self._nb_ouvertes -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._emprunteurs[conn] = threading.get_ident()
+        return conn
+
+    def liberer(self, conn: sqlite3.Connection):
+        """Rend une connexion au pool (ou la ferme si le pool est fermé)."""
+        if conn.in_transaction:
+            conn.rollback()
+        with self._condition:
+            self._emprunteurs.pop(conn, None)
+            if self._ferme:
+                self._nb_ouvertes -= 1
+            else:
+                self._libres.append(conn)
+                conn = None
+            self._condition.notify()
+        if conn is not None:
+            conn.close()
+
+    def fermer(self):
+        """Ferme les connexions libres ; celles encore prêtées le seront à leur retour."""
+        with self._condition:
+            self._ferme = True
+            libres, self._libres = self._libres, []
+            self._nb_ouvertes -= len(libres)
+            self._condition.notify_all()
+        for conn in libres:
+            conn.close()
+
+
+class _CacheResultats:
+    """
+    Cache LRU/TTL des résultats de SELECT, invalidé table par table.
+
+    La mémoire occupée est estimée (sys.getsizeof) et bornée par `octets_max` ;
+    les entrées les moins récemment lues sont évincées en premier.
+    """
+
+    def __init__(
+        self, taille_max: int, ttl: Optional[float] = None, octets_max: int = 0
+    ):
+        self.taille_max = taille_max
+        self.ttl = ttl
+        self.octets_max = octets_max
+        self._entrees = OrderedDict()  # clé -> (expiration, table, lignes, octets)
+        self._par_table = {}  # table -> {clés}
+        self._generations = {}  # table -> compteur d'invalidations
+        self._octets = 0
+        self._verrou = threading.Lock()
+        self.succes = self.echecs = self.evictions = 0
+
+    def generation(self, table: str) -> int:
+        with self._verrou:
+            return self._generations.get(table, 0)
+
+    def lire(self, cle):
+        with self._verrou:
+            entree = self._entrees.get(cle)
+            if entree is not None and (
+                entree[0] is None or entree[0] > time.monotonic()
+            ):
+                self._entrees.move_to_end(cle)
+                self.succes += 1
+                return list(entree[2])
+            if entree is not None:
+                self._retirer(cle)
+            self.echecs += 1
+            return None
+
+    def ecrire(self, cle, table: str, generation: int, lignes: list):
+        octets = sys.getsizeof(lignes) + sum(
+            sys.getsizeof(ligne) + sum(map(sys.getsizeof, ligne)) for ligne in lignes
+        )
+        if self.octets_max and octets > self.octets_max:
+            return
+        expiration = time.monotonic() + self.ttl if self.ttl else None
+        with self._verrou:
+            # Une écriture a invalidé la table pendant la lecture : résultat périmé
+            if self._generations.get(table, 0) != generation:
+                return
+            if cle in self._entrees:
+                self._retirer(cle)
+            self._entrees[cle] = (expiration, table, list(lignes), octets)
+            self._par_table.setdefault(table, set()).add(cle)
+            self._octets += octets
+            while self._entrees and (
+                len(self._entrees) > self.taille_max
+                or (self.octets_max and self._octets > self.octets_max)
+            ):
+                self._retirer(next(iter(self._entrees)))
+                self.evictions += 1
+
+    def invalider(self, table: str):
+        with self._verrou:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            for cle in self._par_table.pop(table, ()):
+                entree = self._entrees.pop(cle, None)
+                if entree is not None:
+                    self._octets -= entree[3]
+
+    def vider(self):
+        with self._verrou:
+            for table in self._par_table:
+                self._generations[table] = self._generations.get(table, 0) + 1
+            self._entrees.clear()
+            self._par_table.clear()
+            self._octets = 0
+
+    def _retirer(self, cle):
+        _, table, _, octets = self._entrees.pop(cle)
+        self._octets -= octets
+        cles = self._par_table.get(table)
+        if cles is not None:
+            cles.discard(cle)
+            if not cles:
+                del self._par_table[table]
+
+    def stats(self) -> dict:
+        with self._verrou:
+            return {
+                "succes": self.succes,
+                "echecs": self.echecs,
+                "evictions": self.evictions,
+                "entrees": len(self._entrees),
+                "octets": self._octets,
+            }
+
+
+class Page(NamedTuple):
+    """Une page de résultats de Database.page (pagination par clé)."""
+
+    lignes: list
+    colonnes: list
+    suivant: Optional[str]  # curseur de la page suivante (None = dernière)
+    precedent: Optional[str]  # curseur de la page précédente (None = première)
+
+
+def _encoder_curseur(sens: str, valeur) -> str:
+    brut = json.dumps([sens, valeur], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(brut).decode("ascii")
+
+
+def _decoder_curseur(curseur: str) -> tuple:
+    try:
+        sens, valeur = json.loads(base64.urlsafe_b64decode(curseur.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Curseur de pagination invalide : {curseur!r}") from e
+    if sens not in (">", "<"):
+        raise ValueError(f"Curseur de pagination invalide : {curseur!r}")
+    return sens, valeur
+
+
+class _EcrivainGroupe:
+    """
+    Thread écrivain unique : prend les écritures dans une file et valide tout
+    ce qui est en attente dans une seule transaction (group commit).
+
+    Chaque écriture passe dans un SAVEPOINT : une requête en erreur n'annule
+    que son propre Future, pas celles du même lot. Les tâches (un lot
+    d'executemany, par exemple) sont exécutées seules, dans leur propre
+    transaction, à leur tour dans la file.
+    """
+
+    def __init__(self, db, taille_lot: int = 500):
+        self._db = db
+        self.taille_lot = taille_lot
+        self._file = queue.Queue()
+        self._arrete = False
+        self._verrou = threading.Lock()
+        self.nb_lots = self.nb_ecritures = 0
+        # Ouverte ici et non dans le thread : une erreur d'ouverture (chemin,
+        # droits) remonte à l'appelant au lieu de tuer le thread en silence
+        self._conn = db._ouvrir()
+        self._conn.isolation_level = None  # transactions gérées explicitement
+        self._thread = threading.Thread(
+            target=self._boucle, name="Database-ecrivain", daemon=True
+        )
+        self._thread.start()
+
+    def soumettre(self, table: str, requete: str, params) -> Future:
+        futur = Future()
+        with self._verrou:
+            if self._arrete:
+                raise sqlite3.ProgrammingError("L'écrivain de la base est arrêté")
+            self._file.put((table, requete, params, futur))
+        return futur
+
+    def executer(self, table: str, fonction):
+        """Exécute fonction(conn) dans le thread écrivain et retourne son résultat."""
+        return self.soumettre(table, None, fonction).result()
+
+    def arreter(self):
+        """Traite les écritures déjà en file puis arrête le thread."""
+        with self._verrou:
+            if self._arrete:
+                return
+            self._arrete = True
+            self._file.put(None)
+        self._thread.join()
+
+    def _boucle(self):
+        conn = self._conn
+        lot = []
+        try:
+            fin = False
+            while not fin:
+                op = self._file.get()
+                if op is None:
+                    break
+                lot = [op]
+                while len(lot) < self.taille_lot:
+                    try:
+                        op = self._file.get_nowait()
+                    except queue.Empty:
+                        break
+                    if op is None:
+                        fin = True
+                        break
+                    lot.append(op)
+                self._traiter(conn, lot)
+                lot = []
+        except BaseException as e:
+            logging.getLogger(__name__).exception("Arrêt inattendu de l'écrivain")
+            erreur = sqlite3.ProgrammingError(
+                f"L'écrivain de la base s'est arrêté : {e}"
+            )
+            erreur.__cause__ = e
+            with self._verrou:
+                self._arrete = True
+            # Plus personne ne videra la file : échouer tout ce qui attend
+            en_attente = [op for op in lot if not op[3].done()]
+            while True:
+                try:
+                    op = self._file.get_nowait()
+                except queue.Empty:
+                    break
+                if op is not None and op[3].set_running_or_notify_cancel():
+                    en_attente.append(op)
+            for *_, futur in en_attente:
+                if not futur.done():
+                    futur.set_exception(erreur)
+        finally:
+            conn.close()
+
+    def _traiter(self, conn: sqlite3.Connection, lot: list):
+        # Requêtes simples groupées ; une tâche (requete None) coupe le groupe
+        simples = []
+        for op in lot:
+            if op[1] is not None:
+                simples.append(op)
+                continue
+            if simples:
+                self._ecrire_lot(conn, simples)
+                simples = []
+            self._executer_tache(conn, op)
+        if simples:
+            self._ecrire_lot(conn, simples)
+
+    def _executer_tache(self, conn: sqlite3.Connection, op):
+        table, _, fonction, futur = op
+        if not futur.set_running_or_notify_cancel():
+            return
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            resultat = fonction(conn)
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            resultat = e
+        self.nb_lots += 1
+        self.nb_ecritures += 1
+        self._db._invalider(table)
+        if isinstance(resultat, Exception):
+            futur.set_exception(resultat)
+        else:
+            futur.set_result(resultat)
+
+    def _ecrire_lot(self, conn: sqlite3.Connection, lot: list):
+        lot = [op for op in lot if op[3].set_running_or_notify_cancel()]
+        if not lot:
+            return
+        resultats = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for table, requete, params, futur in lot:
+                conn.execute("SAVEPOINT ecriture")
+                try:
+                    debut = time.perf_counter()
+                    cur = conn.execute(requete, params)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO ecriture")
+                    resultats.append((futur, e))
+                else:
+                    self._db._tracer(conn, requete, params, debut, 0, cur.rowcount)
+                    resultats.append((futur, cur.rowcount))
+                conn.execute("RELEASE ecriture")
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            resultats = [(futur, e) for *_, futur in lot]
+
+        self.nb_lots += 1
+        self.nb_ecritures += len(lot)
+        for table in {op[0] for op in lot}:
+            self._db._invalider(table)
+        for futur, resultat in resultats:
+            if isinstance(resultat, Exception):
+                futur.set_exception(resultat)
+            else:
+                futur.set_result(resultat)
+
+
+class _Sonde:
+    """Mesure des requêtes de Database, transmise à un ou plusieurs puits."""
+
+    def __init__(self, puits, seuil_lent: float, plan: bool, avec_params: bool):
+        self.puits = tuple(puits)
+        self.seuil_lent = seuil_lent
+        self.plan = plan
+        self.avec_params = avec_params
+
+    def enregistrer(
+        self, conn, requete, params, duree, retournees, modifiees, plusieurs=False
+    ):
+        lente = duree >= self.seuil_lent
+        plan = None
+        if (
+            lente
+            and self.plan
+            and not plusieurs
+            and requete.lstrip()[:6].upper() in ("SELECT", "INSERT", "UPDATE", "DELETE")
+        ):
+            try:
+                plan = [
+                    ligne[3]
+                    for ligne in conn.execute("EXPLAIN QUERY PLAN " + requete, params)
+                ]
+            except sqlite3.Error:
+                plan = None
+        mesure = {
+            "horodatage": time.time(),
+            "requete": requete,
+            "params": (
+                (list(params[:3]) + ["…"] if plusieurs else list(params))
+                if self.avec_params
+                else None
+            ),
+            "duree_ms": duree * 1000,
+            "lignes_retournees": retournees,
+            "lignes_modifiees": modifiees if modifiees >= 0 else None,
+            "lente": lente,
+            "plan": plan,
+        }
+        for puits in self.puits:
+            try:
+                puits(mesure)
+            except Exception:
+                logging.getLogger(__name__).exception("Erreur du puits %r", puits)
+
+
+class PuitsLogger:
+    """Puits de mesures qui écrit dans un logger (WARNING pour les requêtes lentes)."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, niveau=logging.DEBUG):
+        self.logger = logger or logging.getLogger("BiblioUnique.requetes")
+        self.niveau = niveau
+
+    def __call__(self, mesure: dict):
+        niveau = logging.WARNING if mesure["lente"] else self.niveau
+        if self.logger.isEnabledFor(niveau):
+            self.logger.log(
+                niveau,
+                "%.2f ms, %s lignes lues, %s modifiées : %s%s",
+                mesure["duree_ms"],
+                mesure["lignes_retournees"],
+                mesure["lignes_modifiees"],
+                mesure["requete"],
+                f" | plan : {' ; '.join(mesure['plan'])}" if mesure["plan"] else "",
+            )
+
+
+class PuitsMemoire:
+    """Puits de mesures en mémoire : tampon circulaire des `taille` dernières requêtes."""
+
+    def __init__(self, taille: int = 1000):
+        self._mesures = deque(maxlen=taille)
+
+    def __call__(self, mesure: dict):
+        self._mesures.append(mesure)
+
+    def __iter__(self):
+        return iter(list(self._mesures))
+
+    def __len__(self):
+        return len(self._mesures)
+
+    def plus_lentes(self, n: int = 10) -> list:
+        """Les n requêtes les plus lentes du tampon, de la plus lente à la plus rapide."""
+        return sorted(list(self._mesures), key=lambda m: m["duree_ms"], reverse=True)[
+            :n
+        ]
+
+    def vider(self):
+        self._mesures.clear()
+
+
+class PuitsJsonl:
+    """Puits de mesures qui ajoute une ligne JSON par requête dans un fichier."""
+
+    def __init__(self, chemin: str, seulement_lentes: bool = False):
+        self.chemin = chemin
+        self.seulement_lentes = seulement_lentes
+        self._verrou = threading.Lock()
+        self._fichier = open(chemin, "a", encoding="utf-8")
+
+    def __call__(self, mesure: dict):
+        if self.seulement_lentes and not mesure["lente"]:
+            return
+        ligne = json.dumps(mesure, ensure_ascii=False, default=str)
+        with self._verrou:
+            self._fichier.write(ligne + "\n")
+            self._fichier.flush()
+
+    def fermer(self):
+        with self._verrou:
+            self._fichier.close()
+
+
+def panneau_requetes_lentes(journal: PuitsMemoire, n: int = 10):
+    """
+    Panneau Streamlit : les n requêtes les plus lentes d'un PuitsMemoire.
+    exemple : with st.sidebar.expander("Requêtes lentes"): panneau_requetes_lentes(journal)
+    """
+    import streamlit as st
+
+    lentes = journal.plus_lentes(n)
+    if not lentes:
+        st.caption("Aucune requête mesurée")
+        return
+    st.dataframe(
+        [
+            {
+                "durée (ms)": round(m["duree_ms"], 2),
+                "lues": m["lignes_retournees"],
+                "modifiées": m["lignes_modifiees"],
+                "requête": m["requete"],
+            }
+            for m in lentes
+        ]
+    )
+    for m in lentes:
+        if m["plan"]:
+            with st.expander(f"{m['duree_ms']:.1f} ms — {m['requete'][:60]}"):
+                st.code("\n".join(m["plan"]))
+
+
+# Bases encore ouvertes, fermées proprement à l'arrêt de l'interpréteur
+_BASES_OUVERTES = weakref.WeakSet()
+
+
+@atexit.register
+def _fermer_bases_ouvertes():
+    for bd in list(_BASES_OUVERTES):
+        bd.fermer()
+
+
+# Opérateurs autorisés dans les conditions structurées de select_where
+_OPERATEURS_SQL = {
+    "=",
+    "==",
+    "!=",
+    "<>",
+    "<",
+    "<=",
+    ">",
+    ">=",
+    "LIKE",
+    "NOT LIKE",
+    "GLOB",
+    "IS",
+    "IS NOT",
+    "IN",
+    "NOT IN",
+}
+_RE_COLONNE = re.compile(r"^[A-Za-z_][\w.]*$")
+_RE_COLONNE_INDEX = re.compile(r"^[A-Za-z_]\w*(\s+(ASC|DESC))?$", re.I)
+# Prédicats « colonne opérateur » d'une clause WHERE écrite à la main
+_RE_PREDICAT = re.compile(
+    r"\b([A-Za-z_]\w*)\s*(==|<=|>=|<>|!=|=|<|>|\bIN\b|\bIS\b)", re.I
+)
+_MOTS_SQL = {"AND", "OR", "NOT", "NULL", "IS", "IN", "LIKE", "BETWEEN"}
+# Opérateurs qu'un index B-tree sait exploiter
+_OPERATEURS_EGALITE = {"=", "==", "IS", "IN"}
+_OPERATEURS_INTERVALLE = {"<", "<=", ">", ">="}
+_RE_CONDITION_TEXTE = re.compile(r"^\s*(<=|>=|!=|<>|==|=|<|>)\s*(.*?)\s*$", re.S)
+
+
+_SANS_GUILLEMETS = str.maketrans("", "", '"`[]')
+
+
+def _table_cache(table: str) -> str:
+    """
+    Clé de table du cache de résultats : SQLite ignore la casse des noms et
+    main.users désigne users, les deux écritures doivent partager la même clé.
+    """
+    table = table.strip().translate(_SANS_GUILLEMETS).lower()
+    if table.startswith("main."):
+        table = table[5:]
+    return table
+
+
+def _litteral_sql(texte: str):
+    """
+    Convertit un littéral SQL écrit à la main ('texte', 12, 1.5) en valeur Python.
+    Lève ValueError pour une expression (date('now'), autre colonne...).
+    """
+    interieur = texte[1:-1]
+    if (
+        len(texte) >= 2
+        and texte[0] == texte[-1] == "'"
+        and "'" not in interieur.replace("''", "")
+    ):
+        return interieur.replace("''", "'")
+    for conversion in (int, float):
+        try:
+            return conversion(texte)
+        except ValueError:
+            pass
+    raise ValueError(
+        f"Condition texte non littérale : {texte!r} ; utiliser un triplet "
+        "(colonne, opérateur, valeur) avec la valeur calculée en Python"
+    )
+
+
+def _normaliser_conditions(conditions):
+    """
+    Ramène toutes les formes de conditions de select_where à des triplets
+    (colonne, opérateur, valeur), en validant colonnes et opérateurs.
+    """
+    if not conditions:
+        return []
+    if isinstance(conditions, dict):
+        triplets = []
+        for col, val in conditions.items():
+            if isinstance(val, tuple) and len(val) == 2:
+                triplets.append((col, val[0], val[1]))
+                continue
+            if isinstance(val, str):
+                ancien = _RE_CONDITION_TEXTE.match(val)
+                if ancien:
+                    triplets.append(
+                        (col, ancien.group(1), _litteral_sql(ancien.group(2)))
+                    )
+                    continue
+            triplets.append((col, "=", val))
+    else:
+        triplets = [tuple(c) for c in conditions]
+
+    resultat = []
+    for col, op, val in triplets:
+        op = " ".join(str(op).upper().split())
+        if op not in _OPERATEURS_SQL:
+            raise ValueError(f"Opérateur SQL non autorisé : {op!r}")
+        if not _RE_COLONNE.match(col):
+            raise ValueError(f"Nom de colonne invalide : {col!r}")
+        resultat.append((col, op, val))
+    return resultat
+
+
+# Profils de réglage SQLite : PRAGMA appliqués à l'ouverture de chaque connexion
+PROFILS_SQLITE = {
+    # Réglages par défaut de SQLite (journal rollback, synchronous=FULL)
+    "defaut": {},
+    # Plusieurs sessions qui lisent et écrivent en même temps
+    "concurrent": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -20000,  # en Kio (≈ 20 Mo)
+        "mmap_size": 268435456,  # 256 Mo
+        "temp_store": "MEMORY",
+    },
+    # WAL mais chaque commit reste synchronisé sur disque
+    "securise": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+    },
+    # Imports en masse : aucune garantie en cas de coupure de courant
+    "import": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -200000,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY",
+    },
+}
+
+# busy_timeout en premier : le passage en WAL peut devoir attendre un verrou
+_PRAGMAS_AUTORISES = (
+    "busy_timeout",
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+    "foreign_keys",
+)
+_RE_VALEUR_PRAGMA = re.compile(r"^-?\w+$")
+
+
+@lru_cache(maxsize=1024)
+def _predicats_where(where: str) -> tuple:
+    """Extrait (colonne, opérateur) d'une clause WHERE texte, ex. "id = ? AND date > ?"."""
+    return tuple(
+        (col, op.upper())
+        for col, op in _RE_PREDICAT.findall(where or "")
+        if col.upper() not in _MOTS_SQL
+    )
+
+
+@lru_cache(maxsize=1024)
+def _colonnes_indexables(predicats: tuple) -> tuple:
+    """Colonnes qu'un index peut servir : toutes les égalités puis au plus un intervalle."""
+    egalites = sorted({c for c, op in predicats if op in _OPERATEURS_EGALITE})
+    intervalles = [
+        c for c, op in predicats if op in _OPERATEURS_INTERVALLE and c not in egalites
+    ]
+    return tuple(egalites + intervalles[:1])
+
+
+# Construction des requêtes SQL, mémorisée par forme (table + colonnes + clause) :
+# les appels répétés ne refont ni f-string ni join, et le texte identique permet
+# au cache de requêtes préparées de sqlite3 de resservir la même requête.
+
+
+@lru_cache(maxsize=1024)
+def _sql_insert(table: str, colonnes: tuple) -> str:
+    marqueurs = ", ".join(["?"] * len(colonnes))
+    return f"INSERT INTO {table} ({', '.join(colonnes)}) VALUES ({marqueurs})"
+
+
+@lru_cache(maxsize=1024)
+def _sql_update(table: str, colonnes: tuple, where: str) -> str:
+    set_clause = ", ".join([f"{k}=?" for k in colonnes])
+    return f"UPDATE {table} SET {set_clause} WHERE {where}"
+
+
+@lru_cache(maxsize=1024)
+def _sql_delete(table: str, where: str) -> str:
+    return f"DELETE FROM {table} WHERE {where}"
+
+
+@lru_cache(maxsize=1024)
+def _sql_select(table: str, colonnes: Optional[tuple], where: Optional[str]) -> str:
+    colonnes_sql = ", ".join(colonnes) if colonnes else "*"
+    requete = f"SELECT {colonnes_sql} FROM {table}"
+    if where:
+        requete += f" WHERE {where}"
+    return requete
+
+
+@lru_cache(maxsize=1024)
+def _sql_select_where(table: str, forme: tuple, order_by: str, limite: bool) -> str:
+    """forme : ((colonne, opérateur, nombre de valeurs pour IN / NOT IN), ...)"""
+    where_clauses = []
+    for col, op, nb in forme:
+        if op in ("IN", "NOT IN"):
+            where_clauses.append(f"{col} {op} ({', '.join(['?'] * nb)})")
+        else:
+            where_clauses.append(f"{col} {op} ?")
+    requete = f"SELECT * FROM {table}"
+    if where_clauses:
+        requete += " WHERE " + " AND ".join(where_clauses)
+    if order_by:
+        requete += f" ORDER BY {order_by}"
+    if limite:
+        requete += " LIMIT ?"
+    return requete
+
+
+def _convertir_date(texte):
+    d = objToDateFr(texte)
+    if d is None:
+        raise ValueError(f"Date non reconnue : {texte!r}")
+    return d.isoformat()
+
+
+def _convertir_nombre(texte):
+    # Même nettoyage que frToNombre, mais sans repli silencieux sur 0.0
+    propre = (
+        texte.replace("€", "")
+        .replace(",", ".")
+        .replace("\xa0", "")
+        .replace("\u202f", "")
+        .replace(" ", "")
+    )
+    try:
+        return float(propre)
+    except ValueError:
+        raise ValueError(f"Nombre non reconnu : {texte!r}") from None
+
+
+def _convertir_entier(valeur):
+    # "12,7" ou 12.7 lèvent ValueError au lieu d'être tronqués à 12
+    if isinstance(valeur, int):
+        return int(valeur)
+    nombre = _convertir_nombre(valeur) if isinstance(valeur, str) else float(valeur)
+    if not nombre.is_integer():
+        raise ValueError(f"Entier non reconnu : {valeur!r}")
+    return int(nombre)
+
+
+# Conversions des champs texte lus par import_csv / import_jsonl
+_CONVERSIONS = {
+    "texte": str,
+    "entier": _convertir_entier,
+    "nombre": lambda t: _convertir_nombre(t) if isinstance(t, str) else float(t),
+    "date": lambda t: _convertir_date(t) if isinstance(t, str) else t.isoformat(),
+}
+
+
+def _convertisseur_lignes(types: Optional[dict], colonnes: Optional[list]):
+    """
+    Retourne une fonction dict -> dict qui garde `colonnes` (toutes si None) et
+    convertit chaque valeur selon `types` : {"col": "entier" | "nombre" | "date"
+    | "texte" | fonction}. Une cellule vide devient NULL pour les colonnes typées,
+    une cellule illisible lève ValueError (jamais de 0 ou de date par défaut).
+    """
+    conversions = {}
+    for col, type_col in (types or {}).items():
+        if callable(type_col):
+            conversions[col] = type_col
+        elif type_col in _CONVERSIONS:
+            conversions[col] = _CONVERSIONS[type_col]
+        else:
+            raise ValueError(f"Type inconnu pour {col} : {type_col!r}")
+
+    def convertir(ligne: dict) -> dict:
+        if colonnes is not None:
+            ligne = {c: ligne.get(c) for c in colonnes}
+        for col, conversion in conversions.items():
+            valeur = ligne.get(col)
+            if valeur is None or valeur == "":
+                ligne[col] = None
+            else:
+                ligne[col] = conversion(valeur)
+        return ligne
+
+    return convertir
+
+
+class RequetePreparee:
+    """
+    Requête construite une seule fois par Database.prepare : l'appel ne fait
+    plus que lier les valeurs.
+    """
+
+    def __init__(
+        self,
+        db,
+        operation: str,
+        table: str,
+        requete: str,
+        colonnes,
+        cachable: bool = True,
+    ):
+        self.db = db
+        self.operation = operation
+        self.table = table
+        self.requete = requete
+        self.colonnes = colonnes
+        self.cachable = cachable
+
+    def __repr__(self):
+        return f"<RequetePreparee {self.operation} : {self.requete}>"
+
+    def _depuis_dict(self, ligne: dict) -> tuple:
+        """Valeurs d'un dict {colonne: valeur}, réservé à insert (le WHERE n'a que des ?)."""
+        if self.operation != "insert":
+            raise TypeError(
+                f"{self.operation} préparé : passer les valeurs par position, "
+                "le dict est réservé à insert"
+            )
+        manquantes = [c for c in self.colonnes if c not in ligne]
+        if manquantes:
+            raise ValueError(f"Colonnes manquantes : {', '.join(manquantes)}")
+        return tuple(ligne[c] for c in self.colonnes)
+
+    def __call__(self, *valeurs, attendre: bool = True):
+        if len(valeurs) == 1 and isinstance(valeurs[0], dict):
+            valeurs = self._depuis_dict(valeurs[0])
+        if self.operation == "select":
+            return self.db._lire_avec_cache(
+                self.table, self.requete, valeurs, self.cachable
+            )
+        return self.db._ecrire(self.table, self.requete, valeurs, attendre)
+
+    def many(self, lignes, taille_lot: int = 1000) -> dict:
+        """Exécute la requête pour chaque ligne (tuple, ou dict pour insert), par lots via executemany."""
+        if self.operation == "select":
+            raise ValueError("many() ne s'applique qu'aux écritures")
+        lignes = (
+            self._depuis_dict(l) if isinstance(l, dict) else tuple(l) for l in lignes
+        )
+        return self.db._ecrire_par_lots(
+            self.table, lignes, taille_lot, requete=self.requete
+        )
+
+
+class Database:
+    def __init__(
+        self,
+        chemin: str,
+        taille_pool: int = 5,
+        delai_pool: float = 30.0,
+        profil: str = "defaut",
+        pragmas: Optional[dict] = None,
+        cache_resultats: int = 0,
+        ttl_cache: Optional[float] = None,
+        memoire_cache: int = 32 * 1024 * 1024,
+        ecriture_groupee: bool = False,
+        lot_ecriture: int = 500,
+        index_auto: int = 0,
+        cache_requetes: int = 256,
+    ):
+        """
+        Accès simplifié à une base SQLite.
+
+        - taille_pool : nombre maximal de connexions persistantes, partagées
+          entre threads (0 = une connexion ouverte et fermée à chaque appel).
+        - delai_pool : attente maximale (en secondes) d'une connexion libre.
+        - profil : nom d'un profil de PROFILS_SQLITE ("defaut", "concurrent",
+          "securise", "import").
+        - pragmas : réglages explicites qui complètent ou remplacent ceux du
+          profil, ex. {"journal_mode": "WAL", "busy_timeout": 10000}.
+
+        Les PRAGMA sont appliqués une seule fois, à l'ouverture de chaque
+        connexion du pool.
+
+        - cache_resultats : nombre maximal de résultats de select / select_where
+          gardés en cache (0 = pas de cache). Toute écriture passant par cette
+          instance invalide les résultats de la table concernée.
+        - ttl_cache : durée de vie (en secondes) d'un résultat en cache ; utile
+          si d'autres processus écrivent dans la même base.
+        - memoire_cache : mémoire estimée maximale du cache (en octets).
+        - ecriture_groupee : insert / update / delete passent par un thread
+          écrivain unique qui valide tout ce qui est en attente en une seule
+          transaction (au plus `lot_ecriture` écritures par transaction), au
+          lieu de se disputer le verrou d'écriture et de commiter chacun.
+          Les écritures en masse (insert_many, upsert_many, import_*, many des
+          requêtes préparées) et le DDL (creer_table, creer_index...) passent
+          aussi par ce thread, un lot de `taille_lot` lignes par transaction.
+          Refusé pour ":memory:" (l'écrivain y verrait une autre base, vide).
+        - index_auto : si > 0, crée automatiquement l'index conseillé par
+          conseils_index() dès qu'un même filtre a été utilisé `index_auto` fois.
+        - cache_requetes : nombre de requêtes préparées gardées par connexion
+          (cached_statements de sqlite3, 128 par défaut dans sqlite3).
+
+        Une base ":memory:" n'existe que dans sa connexion : le pool est alors
+        limité à une seule connexion pour que tous les appels la partagent.
+        Un appel imbriqué (écriture dans une boucle select_iter, requête dans
+        le callback `progression` d'un export...) y lève donc OperationalError
+        immédiatement ; il en va de même dès qu'un thread détient déjà toutes
+        les connexions du pool.
+        """
+        if profil not in PROFILS_SQLITE:
+            raise ValueError(
+                f"Profil SQLite inconnu : {profil!r} (choix : {', '.join(PROFILS_SQLITE)})"
+            )
+        reglages = {**PROFILS_SQLITE[profil], **(pragmas or {})}
+        for nom, valeur in reglages.items():
+            if nom not in _PRAGMAS_AUTORISES:
+                raise ValueError(f"PRAGMA non pris en charge : {nom!r}")
+            if not _RE_VALEUR_PRAGMA.match(str(valeur)):
+                raise ValueError(f"Valeur invalide pour PRAGMA {nom} : {valeur!r}")
+
+        if ecriture_groupee and chemin in (":memory:", ""):
+            # L'écrivain a sa propre connexion : en mémoire, ce serait une
+            # autre base, vide, sans les tables créées par le pool
+            raise ValueError(
+                "ecriture_groupee n'est pas possible avec une base en mémoire"
+            )
+
+        self.chemin = chemin
+        self.profil = profil
+        self.pragmas = {n: reglages[n] for n in _PRAGMAS_AUTORISES if n in reglages}
+        if chemin == ":memory:" and taille_pool > 1:
+            taille_pool = 1
+        self._pool = (
+            _PoolConnexions(self._ouvrir, taille_pool, delai_pool)
+            if taille_pool > 0
+            else None
+        )
+        # Cache du schéma {table: lignes de PRAGMA table_info}, valable tant
+        # que PRAGMA schema_version ne change pas
+        self._schema = {}
+        self._version_schema = None
+        self._verrou_schema = threading.Lock()
+        self._cache = (
+            _CacheResultats(cache_resultats, ttl_cache, memoire_cache)
+            if cache_resultats > 0
+            else None
+        )
+        self._sonde = None
+        # Filtres observés dans select_where / update / delete, pour le
+        # conseiller d'index : {(table, colonnes): nombre d'utilisations}
+        self._filtres = Counter()
+        self._verrou_filtres = threading.Lock()
+        self.index_auto = index_auto
+        self.cache_requetes = cache_requetes
+        self._ecrivain = (
+            _EcrivainGroupe(self, lot_ecriture) if ecriture_groupee else None
+        )
+        self._planif_backup = None  # (thread, événement d'arrêt)
+        _BASES_OUVERTES.add(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+    def _ouvrir(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.chemin,
+            check_same_thread=False,
+            cached_statements=self.cache_requetes,
+        )
+        for nom, valeur in self.pragmas.items():
+            conn.execute(f"PRAGMA {nom}={valeur}")
+        return conn
+
+    def parametres_actifs(self) -> dict:
+        """
+        Diagnostic : réglages réellement en vigueur sur une connexion de la base.
+
+        Returns:
+            dict: {"chemin", "profil", "pragmas_demandes", "pragmas", "taille_pool"}
+        """
+        with self._connexion() as conn:
+            actifs = {
+                nom: self._lire_trace(conn, f"PRAGMA {nom}")[0][0]
+                for nom in _PRAGMAS_AUTORISES
+            }
+        return {
+            "chemin": self.chemin,
+            "profil": self.profil,
+            "pragmas_demandes": dict(self.pragmas),
+            "pragmas": actifs,
+            "taille_pool": self._pool._taille if self._pool is not None else 0,
+        }
+
+    @contextmanager
+    def _connexion(self):
+        """
+        Prête une connexion le temps d'un bloc `with`.
+        Commit si le bloc se termine normalement, rollback sinon.
+        """
+        if self._pool is None:
+            conn = self._ouvrir()
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+            return
+
+        conn = self._pool.acquerir()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.liberer(conn)
+
+    def _lire_avec_cache(
+        self, table: str, requete: str, params, cachable: bool = True
+    ) -> list:
+        """Exécute un SELECT en passant par le cache de résultats s'il est actif."""
+        cache = self._cache
+        # Seules les lectures d'une table simple, sans sous-requête, sont mises
+        # en cache : ce sont les seules que l'invalidation par table couvre.
+        if cache is None or not cachable or not _RE_COLONNE.match(table):
+            cache = None
+        else:
+            table = _table_cache(table)
+            # Paramètres nommés (:id) : la clé doit porter les valeurs, pas les noms
+            if isinstance(params, dict):
+                cle = (requete, tuple(sorted(params.items())))
+            else:
+                cle = (requete, tuple(params))
+            lignes = cache.lire(cle)
+            if lignes is not None:
+                return lignes
+            generation = cache.generation(table)
+
+        with self._connexion() as conn:
+            cur = conn.cursor()
+            debut = time.perf_counter()
+            cur.execute(requete, params)
+            lignes = cur.fetchall()
+            self._tracer(conn, requete, params, debut, len(lignes))
+        if cache is not None:
+            cache.ecrire(cle, table, generation, lignes)
+        return lignes
+
+    def _invalider(self, table: str):
+        if self._cache is not None and table:
+            self._cache.invalider(_table_cache(table))
+
+    def stats_cache(self) -> dict:
+        """Compteurs du cache de résultats (succes, echecs, evictions, entrees, octets)."""
+        if self._cache is None:
+            return {"succes": 0, "echecs": 0, "evictions": 0, "entrees": 0, "octets": 0}
+        return self._cache.stats()
+
+    def vider_cache(self):
+        """Vide le cache de résultats (ex. après une écriture faite hors de Database)."""
+        if self._cache is not None:
+            self._cache.vider()
+
+    def instrumenter(
+        self,
+        *puits,
+        seuil_lent: float = 0.1,
+        plan: bool = True,
+        avec_params: bool = False,
+    ):
+        """
+        Mesure chaque requête exécutée par la base et transmet la mesure aux puits.
+        exemple :
+            journal = PuitsMemoire(500)
+            db.instrumenter(journal, PuitsJsonl("lentes.jsonl", seulement_lentes=True))
+            journal.plus_lentes(10)
+
+        - puits : PuitsLogger, PuitsMemoire, PuitsJsonl ou toute fonction qui
+          reçoit le dict de mesure (requete, duree_ms, lignes_retournees,
+          lignes_modifiees, lente, plan, ...). Sans puits : désactive la mesure.
+        - seuil_lent : durée (en secondes) à partir de laquelle une requête est lente
+        - plan : ajoute EXPLAIN QUERY PLAN aux mesures des requêtes lentes
+        - avec_params : inclut les paramètres liés (désactivé par défaut,
+          ils peuvent contenir des données personnelles)
+        """
+        self._sonde = _Sonde(puits, seuil_lent, plan, avec_params) if puits else None
+
+    def _tracer(
+        self, conn, requete, params, debut, retournees=0, modifiees=-1, plusieurs=False
+    ):
+        sonde = self._sonde
+        if sonde is not None:
+            sonde.enregistrer(
+                conn,
+                requete,
+                params,
+                time.perf_counter() - debut,
+                retournees,
+                modifiees,
+                plusieurs,
+            )
+
+    def _lire_trace(self, conn, requete: str, params=()) -> list:
+        """execute + fetchall mesurés par la sonde (PRAGMA, catalogue...)."""
+        debut = time.perf_counter()
+        lignes = conn.execute(requete, params).fetchall()
+        self._tracer(conn, requete, params, debut, len(lignes))
+        return lignes
+
+    def fermer(self):
+        """Ferme toutes les connexions persistantes de la base."""
+        self.arreter_backup_auto()
+        if self._ecrivain is not None:
+            self._ecrivain.arreter()
+        if self._pool is not None:
+            self._pool.fermer()
+        _BASES_OUVERTES.discard(self)
+
+    def backup(
+        self,
+        destination: Optional[str] = None,
+        dossier: str = "Historic/db",
+        garder: int = 20,
+        pages: int = 256,
+        pause: float = 0.005,
+        progression=None,
+    ) -> str:
+        """
+        Copie la base à chaud avec l'API de sauvegarde en ligne de SQLite.
+        exemple : db.backup()  # Historic/db/data-20250524-101500-000000.db
+
+        La copie avance par paquets de `pages` pages avec une `pause` entre
+        chaque paquet : les écrivains ne sont bloqués que le temps d'un paquet.
+        Elle est écrite dans un fichier temporaire puis renommée, si bien
+        qu'une sauvegarde interrompue ne laisse jamais de fichier partiel.
+
+        - destination : fichier cible ; par défaut un fichier horodaté dans `dossier`
+        - garder : nombre de sauvegardes conservées dans `dossier`, comme
+          NB_SAUVEGARDE pour sauvegardeAuto (0 = toutes) ; ignoré avec `destination`
+        - progression : fonction appelée avec (pages restantes, pages totales)
+
+        Returns:
+            str: chemin du fichier de sauvegarde
+        """
+        import os
+
+        nom = (
+            "memoire"
+            if self.chemin == ":memory:"
+            else os.path.splitext(os.path.basename(self.chemin))[0]
+        )
+        horodatee = destination is None
+        if horodatee:
+            os.makedirs(dossier, exist_ok=True)
+            horodatage = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+            destination = os.path.join(dossier, f"{nom}-{horodatage}.db")
+
+        temporaire = destination + ".tmp"
+        cible = sqlite3.connect(temporaire)
+        try:
+            with self._connexion() as conn:
+                conn.backup(
+                    cible,
+                    pages=pages,
+                    sleep=pause,
+                    progress=(
+                        (lambda statut, restantes, total: progression(restantes, total))
+                        if progression
+                        else None
+                    ),
+                )
+            cible.close()
+            os.replace(temporaire, destination)
+        except BaseException:
+            cible.close()
+            if os.path.exists(temporaire):
+                os.remove(temporaire)
+            raise
+
+        if garder and horodatee:
+            # Uniquement les sauvegardes de cette base : "data-old-..." n'est pas à "data"
+            motif = re.compile(rf"{re.escape(nom)}-\d{{8}}-\d{{6}}-\d{{6}}\.db")
+            anciennes = sorted(
+                (f for f in os.listdir(dossier) if motif.fullmatch(f)),
+                reverse=True,
+            )
+            for ancienne in anciennes[garder:]:
+                os.remove(os.path.join(dossier, ancienne))
+        return destination
+
+    def backup_auto(self, intervalle: float, **options):
+        """
+        Lance backup(**options) toutes les `intervalle` secondes dans un thread
+        de fond, jusqu'à arreter_backup_auto() ou fermer().
+        exemple : db.backup_auto(3600, garder=24)  # une sauvegarde par heure, 24 gardées
+        Une sauvegarde en échec est journalisée sans arrêter la planification.
+        """
+        if intervalle <= 0:
+            raise ValueError("intervalle doit être strictement positif")
+        self.arreter_backup_auto()
+        arret = threading.Event()
+
+        def boucle():
+            while not arret.wait(intervalle):
+                try:
+                    self.backup(**options)
+                except Exception:
+                    logging.getLogger(__name__).exception(
+                        "Échec de la sauvegarde de %s", self.chemin
+                    )
+
+        thread = threading.Thread(target=boucle, name="Database-backup", daemon=True)
+        self._planif_backup = (thread, arret)
+        thread.start()
+
+    def arreter_backup_auto(self):
+        """Arrête la sauvegarde planifiée (attend la fin d'une copie en cours)."""
+        if self._planif_backup is None:
+            return
+        thread, arret = self._planif_backup
+        self._planif_backup = None
+        arret.set()
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def _schema_connu(self, conn: sqlite3.Connection) -> dict:
+        """
+        Retourne le cache du schéma, rechargé seulement si PRAGMA schema_version
+        a changé (création, modification ou suppression d'une table, y compris
+        depuis une autre connexion ou un autre processus).
+        """
+        version = self._lire_trace(conn, "PRAGMA schema_version")[0][0]
+        with self._verrou_schema:
+            if version != self._version_schema:
+                tables = self._lire_trace(
+                    conn, "SELECT name FROM sqlite_master WHERE type='table'"
+                )
+                self._schema = {
+                    nom: tuple(self._lire_trace(conn, f'PRAGMA table_info("{nom}")'))
+                    for (nom,) in tables
+                }
+                self._version_schema = version
+            return self._schema
+
+    def table_existe(self, nom_table: str) -> bool:
+        with self._connexion() as conn:
+            return nom_table in self._schema_connu(conn)
+
+    def colonnes_table(self, nom_table: str) -> list:
+        """Noms des colonnes d'une table (liste vide si elle n'existe pas)."""
+        with self._connexion() as conn:
+            return [c[1] for c in self._schema_connu(conn).get(nom_table, ())]
+
+    def creer_table(self, nom_table: str, colonnes: dict):
+        """
+        Crée la table si elle n'existe pas.
+        Sans effet (ni DDL ni commit) si la table figure déjà dans le schéma connu.
+        """
+        with self._connexion() as conn:
+            if nom_table in self._schema_connu(conn):
+                return
+        colonnes_sql = ", ".join([f"{nom} {type_}" for nom, type_ in colonnes.items()])
+        requete = f"CREATE TABLE IF NOT EXISTS {nom_table} ({colonnes_sql})"
+        self._ecrire(nom_table, requete, (), True)
+
+    def creer_index(
+        self,
+        table: str,
+        colonnes: list,
+        nom: Optional[str] = None,
+        unique: bool = False,
+        where: Optional[str] = None,
+    ) -> str:
+        """
+        Crée un index (s'il n'existe pas déjà) et retourne son nom.
+        exemples :
+            db.creer_index("travail", ["date"])
+            db.creer_index("travail", ["oui_non", "date DESC"])  # composite
+            db.creer_index("travail", ["date"], where="oui_non = 1")  # partiel
+            db.creer_index("users", ["nom"], unique=True)
+
+        Args:
+            colonnes : colonnes dans l'ordre de l'index (suffixe ASC/DESC accepté)
+            nom : nom de l'index (par défaut idx_<table>_<colonnes>)
+            where : condition d'un index partiel (SQL sans paramètre)
+        """
+        for col in colonnes:
+            if not _RE_COLONNE_INDEX.match(col):
+                raise ValueError(f"Colonne d'index invalide : {col!r}")
+        if nom is None:
+            nom = f"idx_{table}_" + "_".join(c.split()[0] for c in colonnes)
+        if not _RE_COLONNE.match(nom):
+            raise ValueError(f"Nom d'index invalide : {nom!r}")
+        requete = (
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {nom} "
+            f"ON {table} ({', '.join(colonnes)})"
+        )
+        if where:
+            requete += f" WHERE {where}"
+        self._ecrire(table, requete, (), True)
+        return nom
+
+    def supprimer_index(self, nom: str):
+        if not _RE_COLONNE.match(nom):
+            raise ValueError(f"Nom d'index invalide : {nom!r}")
+        self._ecrire("", f"DROP INDEX IF EXISTS {nom}", (), True)
+
+    def index_table(self, table: str) -> list:
+        """
+        Index existants d'une table.
+
+        Returns:
+            list: [{"nom", "colonnes", "unique", "partiel"}, ...]
+        """
+        with self._connexion() as conn:
+            index = []
+            for _, nom, unique, origine, partiel in self._lire_trace(
+                conn, f'PRAGMA index_list("{table}")'
+            ):
+                colonnes = [
+                    c[2]
+                    for c in sorted(
+                        self._lire_trace(conn, f'PRAGMA index_info("{nom}")')
+                    )
+                ]
+                index.append(
+                    {
+                        "nom": nom,
+                        "colonnes": colonnes,
+                        "unique": bool(unique),
+                        "partiel": bool(partiel),
+                    }
+                )
+        return index
+
+    def _observer_filtre(self, table: str, predicats: tuple):
+        """Compte un filtre utilisé, réduit aux colonnes qu'un index peut servir."""
+        colonnes = _colonnes_indexables(predicats)
+        if not colonnes:
+            return
+        with self._verrou_filtres:
+            self._filtres[(table, colonnes)] += 1
+            nombre = self._filtres[(table, colonnes)]
+        if self.index_auto and nombre == self.index_auto:
+            for conseil in self.conseils_index(self.index_auto):
+                if (conseil["table"], tuple(conseil["colonnes"])) == (table, colonnes):
+                    self.creer_index(table, list(colonnes), conseil["nom"])
+
+    def conseils_index(self, seuil: int = 20) -> list:
+        """
+        Conseiller d'index : filtres utilisés au moins `seuil` fois dans
+        select_where / update / delete et qu'aucun index existant ne couvre.
+
+        Returns:
+            list: [{"table", "colonnes", "nom", "utilisations", "sql"}, ...], du plus
+            fréquent au moins fréquent
+        """
+        with self._verrou_filtres:
+            frequents = [(cle, n) for cle, n in self._filtres.items() if n >= seuil]
+        conseils = []
+        index_par_table = {}
+        for (table, colonnes), nombre in sorted(frequents, key=lambda x: -x[1]):
+            if table not in index_par_table:
+                with self._connexion() as conn:
+                    schema = self._schema_connu(conn).get(table, ())
+                cles = [c[1] for c in schema if c[5]]
+                index_par_table[table] = (
+                    cles[0] if len(cles) == 1 else None,
+                    self.index_table(table),
+                )
+            cle_primaire, existants = index_par_table[table]
+            # Un index partiel ne sert que les requêtes qui reprennent sa condition
+            couvert = cle_primaire in colonnes or any(
+                set(i["colonnes"][: len(colonnes)]) == set(colonnes)
+                for i in existants
+                if not i["partiel"]
+            )
+            if couvert:
+                continue
+            nom = base = f"idx_{table}_{'_'.join(colonnes)}"
+            suffixe = 1
+            while any(i["nom"] == nom for i in existants):
+                suffixe += 1
+                nom = f"{base}_{suffixe}"
+            conseils.append(
+                {
+                    "table": table,
+                    "colonnes": list(colonnes),
+                    "nom": nom,
+                    "utilisations": nombre,
+                    "sql": f"CREATE INDEX {nom} ON {table} ({', '.join(colonnes)})",
+                }
+            )
+        return conseils
+
+    def appliquer_conseils_index(self, seuil: int = 20) -> list:
+        """Crée les index conseillés par conseils_index(seuil) et retourne leurs noms."""
+        return [
+            self.creer_index(c["table"], c["colonnes"], c["nom"])
+            for c in self.conseils_index(seuil)
+        ]
+
+    def insert(self, table: str, valeurs: dict, attendre: bool = True):
+        """
+        Insère une ligne.
+        Avec attendre=False, retourne un Future (résultat : nombre de lignes
+        écrites) au lieu d'attendre la fin de l'écriture.
+        """
+        requete = _sql_insert(table, tuple(valeurs))
+        return self._ecrire(table, requete, tuple(valeurs.values()), attendre)
+
+    def _ecrire(self, table: str, requete: str, params, attendre: bool):
+        if self._ecrivain is not None:
+            futur = self._ecrivain.soumettre(table, requete, params)
+            if attendre:
+                futur.result()
+                return None
+            return futur
+
+        with self._connexion() as conn:
+            cur = conn.cursor()
+            debut = time.perf_counter()
+            cur.execute(requete, params)
+            conn.commit()
+            self._tracer(conn, requete, params, debut, 0, cur.rowcount)
+        self._invalider(table)
+        if not attendre:
+            futur = Future()
+            futur.set_result(cur.rowcount)
+            return futur
+
+    def insert_many(self, table: str, lignes, taille_lot: int = 1000) -> dict:
+        """
+        Insère en masse des lignes (itérable ou générateur de dict).
+        exemple : db.insert_many("users", ({"nom": n, "age": 30} for n in noms))
+
+        Les lignes sont regroupées par lots de `taille_lot`, chaque lot étant
+        écrit par un seul executemany dans une seule transaction.
+        Toutes les lignes doivent avoir les mêmes clés que la première.
+
+        Returns:
+            dict: {"lignes", "lots", "duree", "lignes_par_seconde"}
+        """
+        return self._ecrire_par_lots(table, lignes, taille_lot)
+
+    def upsert_many(
+        self,
+        table: str,
+        lignes,
+        cles: list,
+        colonnes_maj: Optional[list] = None,
+        taille_lot: int = 1000,
+    ) -> dict:
+        """
+        Insère ou met à jour en masse (INSERT ... ON CONFLICT ... DO UPDATE).
+        exemple : db.upsert_many("users", lignes, cles=["id"])
+
+        - cles : colonnes de la contrainte UNIQUE / PRIMARY KEY en conflit
+        - colonnes_maj : colonnes mises à jour en cas de conflit
+          (par défaut toutes les colonnes hors clés ; liste vide = DO NOTHING)
+
+        Returns:
+            dict: {"lignes", "lots", "duree", "lignes_par_seconde"}
+        """
+        return self._ecrire_par_lots(table, lignes, taille_lot, cles, colonnes_maj)
+
+    def import_csv(
+        self,
+        table: str,
+        chemin: str,
+        types: Optional[dict] = None,
+        colonnes: Optional[list] = None,
+        cles: Optional[list] = None,
+        taille_lot: int = 1000,
+        delimiteur: str = ",",
+        encodage: str = "utf-8",
+        progression=None,
+    ) -> dict:
+        """
+        Importe un fichier CSV (avec ligne d'en-tête) dans `table`, en flux :
+        le fichier est lu ligne à ligne et écrit par lots de `taille_lot`.
+        exemple : db.import_csv("feries", "jours_feries_metropole.csv",
+                                types={"date": "date"}, cles=["date"])
+
+        - types : conversions par colonne, "entier" / "nombre" (format
+          français, "12 345,67 €" accepté), "date" (via objToDateFr, stockée en ISO),
+          "texte" ou une fonction ; les autres colonnes restent du texte
+        - colonnes : colonnes du fichier à importer (toutes par défaut)
+        - cles : si fourni, upsert sur ces colonnes au lieu d'un simple INSERT
+        - progression : fonction appelée avec le nombre de lignes écrites après chaque lot
+
+        Returns:
+            dict: {"lignes", "lots", "duree", "lignes_par_seconde"}
+        """
+        import csv
+
+        convertir = _convertisseur_lignes(types, colonnes)
+        with open(chemin, "r", encoding=encodage, newline="") as f:
+            lignes = map(convertir, csv.DictReader(f, delimiter=delimiteur))
+            return self._ecrire_par_lots(
+                table, lignes, taille_lot, cles, progression=progression
+            )
+
+    def import_jsonl(
+        self,
+        table: str,
+        chemin: str,
+        types: Optional[dict] = None,
+        colonnes: Optional[list] = None,
+        cles: Optional[list] = None,
+        taille_lot: int = 1000,
+        encodage: str = "utf-8",
+        progression=None,
+    ) -> dict:
+        """
+        Importe un fichier JSON Lines (un objet par ligne) dans `table`, en flux.
+        Mêmes options que import_csv ; les lignes vides sont ignorées. Sans
+        `colonnes`, tous les objets doivent avoir les mêmes clés.
+        """
+        convertir = _convertisseur_lignes(types, colonnes)
+        with open(chemin, "r", encoding=encodage) as f:
+            lignes = (convertir(json.loads(l)) for l in f if l.strip())
+            return self._ecrire_par_lots(
+                table, lignes, taille_lot, cles, progression=progression
+            )
+
+    def export_csv(
+        self,
+        table: str,
+        chemin: str,
+        colonnes: Optional[list] = None,
+        where: Optional[str] = None,
+        params: tuple = (),
+        taille_lot: int = 1000,
+        delimiteur: str = ",",
+        encodage: str = "utf-8",
+        progression=None,
+    ) -> int:
+        """
+        Exporte `table` (ou le résultat filtré par `where`) dans un fichier CSV
+        avec en-tête, en flux via select_iter. Retourne le nombre de lignes écrites.
+        exemple : db.export_csv("users", "users.csv", where="age > ?", params=(18,))
+        """
+        import csv
+
+        colonnes = list(colonnes or self.colonnes_table(table))
+        with open(chemin, "w", encoding=encodage, newline="") as f:
+            ecrivain = csv.writer(f, delimiter=delimiteur)
+            ecrivain.writerow(colonnes)
+            return self._exporter(
+                table,
+                colonnes,
+                where,
+                params,
+                taille_lot,
+                ecrivain.writerow,
+                progression,
+            )
+
+    def export_jsonl(
+        self,
+        table: str,
+        chemin: str,
+        colonnes: Optional[list] = None,
+        where: Optional[str] = None,
+        params: tuple = (),
+        taille_lot: int = 1000,
+        encodage: str = "utf-8",
+        progression=None,
+    ) -> int:
+        """
+        Exporte `table` en JSON Lines (un objet par ligne), en flux.
+        Retourne le nombre de lignes écrites.
+        """
+        colonnes = list(colonnes or self.colonnes_table(table))
+        with open(chemin, "w", encoding=encodage) as f:
+
+            def ecrire(ligne):
+                f.write(json.dumps(dict(zip(colonnes, ligne)), ensure_ascii=False))
+                f.write("\n")
+
+            return self._exporter(
+                table, colonnes, where, params, taille_lot, ecrire, progression
+            )
+
+    def _exporter(
+        self, table, colonnes, where, params, taille_lot, ecrire, progression
+    ) -> int:
+        if not colonnes:
+            raise ValueError(f"Table inconnue ou sans colonnes : {table}")
+        nb_lignes = 0
+        for ligne in self.select_iter(table, colonnes, where, params, taille_lot):
+            ecrire(ligne)
+            nb_lignes += 1
+            if progression and nb_lignes % taille_lot == 0:
+                progression(nb_lignes)
+        if progression and nb_lignes % taille_lot:
+            progression(nb_lignes)
+        return nb_lignes
+
+    def _ecrire_par_lots(
+        self,
+        table,
+        lignes,
+        taille_lot,
+        cles=None,
+        colonnes_maj=None,
+        requete=None,
+        progression=None,
+    ) -> dict:
+        if taille_lot < 1:
+            raise ValueError("taille_lot doit être supérieur ou égal à 1")
+
+        iterateur = iter(lignes)
+        debut = time.perf_counter()
+        total = nb_lots = 0
+
+        premiere = next(iterateur, None)
+        if premiere is not None and requete is not None:
+            # Requête préparée : les lignes sont déjà des tuples de valeurs
+            valeurs = tuple
+        elif premiere is not None:
+            colonnes = tuple(premiere.keys())
+            requete = _sql_insert(table, colonnes)
+            if cles:
+                if colonnes_maj is None:
+                    colonnes_maj = [c for c in colonnes if c not in cles]
+                requete += f" ON CONFLICT ({', '.join(cles)}) DO "
+                if colonnes_maj:
+                    requete += "UPDATE SET " + ", ".join(
+                        f"{c}=excluded.{c}" for c in colonnes_maj
+                    )
+                else:
+                    requete += "NOTHING"
+
+            def valeurs(ligne):
+                if ligne.keys() != premiere.keys():
+                    raise ValueError(
+                        f"Colonnes incohérentes : {sorted(ligne)} au lieu de {sorted(colonnes)}"
+                    )
+                return tuple(ligne[c] for c in colonnes)
+
+        def ecrire_lot(conn, lot):
+            debut_lot = time.perf_counter()
+            cur = conn.executemany(requete, lot)
+            self._tracer(conn, requete, lot, debut_lot, 0, cur.rowcount, True)
+
+        if premiere is not None:
+            try:
+                # Avec l'écrivain groupé, chaque lot est une tâche de sa file :
+                # aucune connexion du pool ne prend le verrou d'écriture
+                with (
+                    nullcontext() if self._ecrivain is not None else self._connexion()
+                ) as conn:
+                    lot = [valeurs(premiere)]
+                    lot.extend(map(valeurs, islice(iterateur, taille_lot - 1)))
+                    while lot:
+                        if conn is None:
+                            self._ecrivain.executer(table, partial(ecrire_lot, lot=lot))
+                        else:
+                            with conn:
+                                ecrire_lot(conn, lot)
+                        total += len(lot)
+                        nb_lots += 1
+                        if progression:
+                            progression(total)
+                        lot = list(map(valeurs, islice(iterateur, taille_lot)))
+            finally:
+                # Les lots déjà validés restent écrits même si un lot échoue
+                self._invalider(table)
+
+        duree = time.perf_counter() - debut
+        return {
+            "lignes": total,
+            "lots": nb_lots,
+            "duree": duree,
+            "lignes_par_seconde": total / duree if duree > 0 else 0.0,
+        }
+
+    def select(
+        self,
+        table: str,
+        colonnes: Optional[list] = None,
+        where: Optional[str] = None,
+        params: tuple = (),
+    ):
+        requete, params = self._requete_select(table, colonnes, where, params)
+        sous_requete = bool(where) and "select" in where.lower()
+        return self._lire_avec_cache(table, requete, params, not sous_requete)
+
+    def select_colonnes(
+        self,
+        table: str,
+        colonnes: Optional[list] = None,
+        where: Optional[str] = None,
+        params: tuple = (),
+        format: Literal["dict", "numpy", "pandas", "arrow"] = "dict",
+        taille_lot: int = 1000,
+    ):
+        """
+        Variante de `select` qui retourne les données par colonne.
+        exemple : db.select_colonnes("users", ["nom", "age"])["age"] -> [31, 45, ...]
+
+        Les lignes sont lues par lots (fetchmany) et transposées lot par lot,
+        sans créer de dict par ligne.
+
+        format :
+          - "dict"   ➜ {colonne: liste de valeurs}
+          - "numpy"  ➜ {colonne: numpy.ndarray}  (numpy requis)
+          - "pandas" ➜ pandas.DataFrame           (pandas requis)
+          - "arrow"  ➜ pyarrow.Table              (pyarrow requis)
+        """
+        if format not in ("dict", "numpy", "pandas", "arrow"):
+            raise ValueError(f"Format de résultat inconnu : {format!r}")
+        if taille_lot < 1:
+            raise ValueError("taille_lot doit être supérieur ou égal à 1")
+
+        requete, params = self._requete_select(table, colonnes, where, params)
+        with self._connexion() as conn:
+            cur = conn.cursor()
+            debut = time.perf_counter()
+            cur.execute(requete, params)
+            noms = [d[0] for d in cur.description]
+            valeurs = [[] for _ in noms]
+            while True:
+                lot = cur.fetchmany(taille_lot)
+                if not lot:
+                    break
+                for liste, colonne in zip(valeurs, zip(*lot)):
+                    liste.extend(colonne)
+            self._tracer(conn, requete, params, debut, len(valeurs[0]) if noms else 0)
+        donnees = dict(zip(noms, valeurs))
+
+        if format == "numpy":
+            try:
+                import numpy as np
+            except ImportError:
+                raise RuntimeError("numpy est requis pour format='numpy'.")
+            return {nom: np.asarray(v) for nom, v in donnees.items()}
+        if format == "pandas":
+            try:
+                import pandas as pd
+            except ImportError:
+                raise RuntimeError("pandas est requis pour format='pandas'.")
+            return pd.DataFrame(donnees, columns=noms)
+        if format == "arrow":
+            try:
+                import pyarrow as pa
+            except ImportError:
+                raise RuntimeError("pyarrow est requis pour format='arrow'.")
+            return pa.table(donnees)
+        return donnees
+
+    def page(
+        self,
+        table: str,
+        taille: int = 50,
+        curseur: Optional[str] = None,
+        colonnes: Optional[list] = None,
+        cle: Optional[str] = None,
+    ) -> Page:
+        """
+        Pagination par clé (keyset) : lit une page de `taille` lignes triées
+        sur la clé primaire, sans OFFSET, en coût constant quelle que soit la
+        position dans la table.
+        exemple :
+            p = db.page("users", 50)
+            p = db.page("users", 50, curseur=p.suivant)
+
+        Args:
+            curseur : p.suivant ou p.precedent d'une page déjà lue (None = 1re page)
+            colonnes : colonnes à lire (toutes par défaut)
+            cle : colonne de tri unique (clé primaire de la table, sinon rowid)
+
+        Returns:
+            Page: (lignes, colonnes, suivant, precedent)
+        """
+        if taille < 1:
+            raise ValueError("taille doit être supérieur ou égal à 1")
+        with self._connexion() as conn:
+            schema = self._schema_connu(conn).get(table, ())
+        if cle is None:
+            cles = [c[1] for c in schema if c[5]]
+            cle = cles[0] if len(cles) == 1 else "rowid"
+        for col in [cle, *(colonnes or [])]:
+            if not _RE_COLONNE.match(col):
+                raise ValueError(f"Nom de colonne invalide : {col!r}")
+        noms = list(colonnes) if colonnes else [c[1] for c in schema]
+
+        sens, valeur = _decoder_curseur(curseur) if curseur else (">", None)
+        requete = (
+            f"SELECT {cle}, {', '.join(colonnes) if colonnes else '*'} FROM {table}"
+        )
+        params = []
+        if valeur is not None:
+            requete += f" WHERE {cle} {sens} ?"
+            params.append(valeur)
+        requete += f" ORDER BY {cle} {'ASC' if sens == '>' else 'DESC'} LIMIT ?"
+        params.append(taille + 1)
+
+        lignes = self._lire_avec_cache(table, requete, params)
+        encore = len(lignes) > taille
+        lignes = lignes[:taille]
+        if sens == "<":
+            lignes.reverse()
+        if not lignes:
+            return Page([], noms, None, None)
+
+        premiere, derniere = lignes[0][0], lignes[-1][0]
+        if sens == ">":
+            suivant = _encoder_curseur(">", derniere) if encore else None
+            precedent = _encoder_curseur("<", premiere) if valeur is not None else None
+        else:
+            suivant = _encoder_curseur(">", derniere)
+            precedent = _encoder_curseur("<", premiere) if encore else None
+        return Page([ligne[1:] for ligne in lignes], noms, suivant, precedent)
+
+    def select_iter(
+        self,
+        table: str,
+        colonnes: Optional[list] = None,
+        where: Optional[str] = None,
+        params: tuple = (),
+        taille_lot: int = 500,
+    ):
+        """
+        Variante paresseuse de `select` : générateur qui lit les lignes par
+        lots de `taille_lot` (fetchmany) au lieu de tout charger en mémoire.
+        exemple : for ligne in db.select_iter("users", taille_lot=1000): ...
+
+        La connexion reste prêtée pendant toute la vie du générateur et est
+        rendue dès qu'il est épuisé, fermé (close()) ou abandonné.
+        """
+        requete, params = self._requete_select(table, colonnes, where, params)
+        return self._iterer(requete, params, taille_lot)
+
+    @staticmethod
+    def _requete_select(table, colonnes, where, params):
+        requete = _sql_select(table, tuple(colonnes) if colonnes else None, where)
+        # Convertir params en liste pour éviter les problèmes avec les tuples
+        if isinstance(params, tuple) and len(params) == 1:
+            params = [params[0]]
+        return requete, params
+
+    def _iterer(self, requete: str, params, taille_lot: int):
+        if taille_lot < 1:
+            raise ValueError("taille_lot doit être supérieur ou égal à 1")
+        with self._connexion() as conn:
+            cur = conn.cursor()
+            # Seul le temps passé dans SQLite est mesuré, pas celui du consommateur
+            debut = time.perf_counter()
+            duree = nb_lignes = 0
+            try:
+                cur.execute(requete, params)
+                while True:
+                    lot = cur.fetchmany(taille_lot)
+                    duree += time.perf_counter() - debut
+                    if not lot:
+                        break
+                    nb_lignes += len(lot)
+                    yield from lot
+                    debut = time.perf_counter()
+            finally:
+                cur.close()
+                # _tracer attend un instant de début : on le recule de `duree`
+                self._tracer(
+                    conn, requete, params, time.perf_counter() - duree, nb_lignes
+                )
+
+    def DeleteTable(self, table: str):
+        self._ecrire(table, f"DROP TABLE IF EXISTS {table}", (), True)
+
+    def update(
+        self,
+        table: str,
+        valeurs: dict,
+        where: str,
+        params: tuple = (),
+        attendre: bool = True,
+    ):
+        """
+        Met à jour des lignes avec conditions dynamiques.
+        exemples : db.update("travail", {"oui_non": 1}, "id = ?", (fichID,)) #1 condition
+        exemples : db.update("travail", {"oui_non": 1}, "id = ? AND date = ?", (fichID, date)) #2 conditions
+        attendre=False : retourne un Future (nombre de lignes modifiées) sans attendre l'écriture
+        Usage des guillemets dans les conditions :
+        - Pour une égalité simple : {"date": "2025-05-24"}
+        - Pour d'autres opérateurs : {"date": "> '2025-05-24'"}
+
+        Exemples :
+        - Dates après une date donnée :
+          {"date": "> '2025-05-24'"}
+        - Dates avant ou égales :
+          {"date": "<= '2025-05-24'"}
+        - Plusieurs conditions :
+          {
+              "date": "> '2025-05-24'",
+              "oui_non": "1"
+          }
+        - Valeurs textuelles avec apostrophes :
+          {"nom": "O'Connor"}  # Les apostrophes sont automatiquement échappées
+        """
+        self._observer_filtre(table, _predicats_where(where))
+        requete = _sql_update(table, tuple(valeurs), where)
+        return self._ecrire(
+            table, requete, tuple(valeurs.values()) + tuple(params), attendre
+        )
+
+    def delete(self, table: str, where: str, params: tuple = (), attendre: bool = True):
+        """
+        Supprime des lignes avec conditions dynamiques.
+        exemples : db.delete("travail", "id = ?", (fichID,)) #1 condition
+        exemples : db.delete("travail", "id = ? AND date = ?", (fichID, date)) #2 conditions
+        attendre=False : retourne un Future (nombre de lignes supprimées) sans attendre l'écriture
+        Usage des guillemets dans les conditions :
+        - Pour une égalité simple : {"date": "2025-05-24"}
+        - Pour d'autres opérateurs : {"date": "> '2025-05-24'"}
+
+        Exemples :
+        - Dates après une date donnée :
+          {"date": "> '2025-05-24'"}
+        - Dates avant ou égales :
+          {"date": "<= '2025-05-24'"}
+        - Plusieurs conditions :
+          {
+              "date": "> '2025-05-24'",
+              "oui_non": "1"
+          }
+        - Valeurs textuelles avec apostrophes :
+          {"nom": "O'Connor"}  # Les apostrophes sont automatiquement échappées
+        """
+        self._observer_filtre(table, _predicats_where(where))
+        requete = _sql_delete(table, where)
+        return self._ecrire(table, requete, params, attendre)
+
+    def prepare(
+        self,
+        operation: Literal["insert", "update", "delete", "select"],
+        table: str,
+        colonnes: list = None,
+        where: str = None,
+    ) -> RequetePreparee:
+        """
+        Construit une fois la requête d'une opération répétée et retourne un
+        RequetePreparee qui ne fait plus que lier les valeurs à chaque appel.
+        exemples :
+            ajouter = db.prepare("insert", "users", ["name", "age"])
+            ajouter("Alice", 30) ou ajouter({"name": "Alice", "age": 30})
+            ajouter.many([("Bob", 25), ("Carla", 41)])
+            maj_age = db.prepare("update", "users", ["age"], "id = ?")
+            maj_age(31, 1)  # valeurs du SET puis paramètres du WHERE
+            par_id = db.prepare("select", "users", where="id = ?")
+            par_id(1)
+        """
+        colonnes = tuple(colonnes or ())
+        for col in colonnes:
+            if not _RE_COLONNE.match(col):
+                raise ValueError(f"Nom de colonne invalide : {col!r}")
+
+        if operation == "insert":
+            if not colonnes:
+                raise ValueError("insert préparé : colonnes requises")
+            requete = _sql_insert(table, colonnes)
+        elif operation == "update":
+            if not colonnes or not where:
+                raise ValueError("update préparé : colonnes et where requis")
+            requete = _sql_update(table, colonnes, where)
+        elif operation == "delete":
+            if not where:
+                raise ValueError("delete préparé : where requis")
+            requete = _sql_delete(table, where)
+        elif operation == "select":
+            requete = _sql_select(table, colonnes or None, where)
+        else:
+            raise ValueError(f"Opération inconnue : {operation!r}")
+
+        if where:
+            self._observer_filtre(table, _predicats_where(where))
+        # Comme select() : une sous-requête lit d'autres tables que `table`
+        sous_requete = bool(where) and "select" in where.lower()
+        return RequetePreparee(
+            self, operation, table, requete, colonnes, cachable=not sous_requete
+        )
+
+    def select_where(
+        self, table: str, conditions: dict = None, order_by: str = "", limit: int = None
+    ):
+        """
+        Sélectionne des lignes avec conditions dynamiques.
+
+        Toutes les valeurs sont passées en paramètres liés (?) : la requête
+        SQL garde la même forme d'un appel à l'autre et profite du cache de
+        requêtes préparées de sqlite3.
+
+        Formes acceptées pour les conditions :
+        - Liste de triplets (colonne, opérateur, valeur) :
+          [("date", ">=", "2025-05-24"), ("oui_non", "=", 1)]
+        - Dict {colonne: valeur} pour une égalité simple :
+          {"date": "2025-05-24"}
+        - Dict {colonne: (opérateur, valeur)} :
+          {"date": (">", "2025-05-24")}
+        - Ancienne forme texte, toujours acceptée si la valeur est un littéral
+          (elle est extraite puis liée) : {"date": "> '2025-05-24'"} ; une
+          expression SQL ({"d": ">= date('now')"}) lève ValueError
+
+        Opérateurs : =, !=, <>, <, <=, >, >=, LIKE, NOT LIKE, GLOB, IS,
+        IS NOT, IN, NOT IN (pour IN / NOT IN, la valeur est une séquence).
+
+        Exemples :
+        - Dates après une date donnée :
+          [("date", ">", "2025-05-24")]
+        - Plusieurs conditions :
+          [("date", ">", "2025-05-24"), ("oui_non", "=", 1)]
+        - Valeurs textuelles avec apostrophes :
+          {"nom": "O'Connor"}  # aucun échappement nécessaire
+
+        Args:
+            table (str): Nom de la table
+            conditions (list | dict, optional): Conditions de sélection
+            order_by (str, optional): Clause ORDER BY
+            limit (int, optional): Limite du nombre de résultats
+
+        Returns:
+            list: Liste des résultats
+        """
+        requete, valeurs = self._requete_select_where(
+            table, conditions, order_by, limit
+        )
+        return self._lire_avec_cache(table, requete, valeurs)
+
+    def select_where_iter(
+        self,
+        table: str,
+        conditions: dict = None,
+        order_by: str = "",
+        limit: int = None,
+        taille_lot: int = 500,
+    ):
+        """
+        Variante paresseuse de `select_where` (mêmes conditions) : générateur
+        qui lit les lignes par lots de `taille_lot`.
+        """
+        requete, valeurs = self._requete_select_where(
+            table, conditions, order_by, limit
+        )
+        return self._iterer(requete, valeurs, taille_lot)
+
+    def _requete_select_where(self, table, conditions, order_by, limit):
+        forme = []
+        valeurs = []
+        for col, op, val in _normaliser_conditions(conditions):
+            if op in ("IN", "NOT IN"):
+                val = list(val)
+                forme.append((col, op, len(val)))
+                valeurs.extend(val)
+            else:
+                forme.append((col, op, 1))
+                valeurs.append(val)
+        if limit is not None:
+            valeurs.append(int(limit))
+
+        forme = tuple(forme)
+        self._observer_filtre(table, tuple((col, op) for col, op, _ in forme))
+        requete = _sql_select_where(table, forme, order_by or "", limit is not None)
+        return requete, valeurs
+
+
+class AsyncDatabase:
+    """
+    Façade asynchrone de Database : mêmes méthodes, sous forme de coroutines.
+
+    Chaque appel s'exécute dans un pool de threads dédié, ce qui libère la
+    boucle d'événements pendant les entrées/sorties SQLite ; plusieurs
+    requêtes peuvent ainsi tourner en parallèle.
+    exemple :
+        adb = AsyncDatabase("data.db", nb_threads=4, profil="concurrent")
+        users, jours = await asyncio.gather(
+            adb.select("users"), adb.select_where("travail", {"oui_non": 1})
+        )
+
+    - base : chemin de la base, ou instance de Database existante
+    - nb_threads : nombre de threads qui exécutent les requêtes
+    - taille_file : nombre maximal d'appels en cours ou en attente (par boucle
+      d'événements) ; au-delà, les appelants attendent une place libre
+    - options : paramètres transmis à Database si `base` est un chemin
+
+    Fermeture : `async with AsyncDatabase(...)` ou `await adb.aclose()` depuis
+    une coroutine ; fermer() bloque le thread appelant.
+    """
+
+    def __init__(
+        self,
+        base: Union[str, Database],
+        nb_threads: int = 4,
+        taille_file: int = 64,
+        **options,
+    ):
+        if isinstance(base, Database):
+            self.db = base
+            self._proprietaire = False
+        else:
+            options.setdefault("taille_pool", nb_threads)
+            self.db = Database(base, **options)
+            self._proprietaire = True
+        self.taille_file = taille_file
+        self._executeur = ThreadPoolExecutor(
+            max_workers=nb_threads, thread_name_prefix="AsyncDatabase"
+        )
+        self._files = weakref.WeakKeyDictionary()  # boucle -> asyncio.Semaphore
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    def _file_attente(self):
+        """Sémaphore qui borne les appels en vol, propre à la boucle courante."""
+        import asyncio
+
+        boucle = asyncio.get_running_loop()
+        file = self._files.get(boucle)
+        if file is None:
+            file = self._files[boucle] = asyncio.Semaphore(self.taille_file)
+        return file
+
+    async def _executer(self, methode, *args, **kwargs):
+        import asyncio
+
+        async with self._file_attente():
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executeur, partial(methode, *args, **kwargs)
+            )
+
+    def fermer(self):
+        """Attend la fin des appels en cours puis ferme les threads (et la base si créée ici)."""
+        self._executeur.shutdown(wait=True)
+        if self._proprietaire:
+            self.db.fermer()
+
+    async def aclose(self):
+        """Version asynchrone de fermer : les attentes ne bloquent pas la boucle."""
+        import asyncio
+
+        await asyncio.get_running_loop().run_in_executor(None, self.fermer)
+
+    async def table_existe(self, *args, **kwargs):
+        return await self._executer(self.db.table_existe, *args, **kwargs)
+
+    async def colonnes_table(self, *args, **kwargs):
+        return await self._executer(self.db.colonnes_table, *args, **kwargs)
+
+    async def creer_table(self, *args, **kwargs):
+        return await self._executer(self.db.creer_table, *args, **kwargs)
+
+    async def creer_index(self, *args, **kwargs):
+        return await self._executer(self.db.creer_index, *args, **kwargs)
+
+    async def supprimer_index(self, *args, **kwargs):
+        return await self._executer(self.db.supprimer_index, *args, **kwargs)
+
+    async def index_table(self, *args, **kwargs):
+        return await self._executer(self.db.index_table, *args, **kwargs)
+
+    async def insert(self, *args, **kwargs):
+        return await self._executer(self.db.insert, *args, **kwargs)
+
+    async def insert_many(self, *args, **kwargs):
+        return await self._executer(self.db.insert_many, *args, **kwargs)
+
+    async def upsert_many(self, *args, **kwargs):
+        return await self._executer(self.db.upsert_many, *args, **kwargs)
+
+    async def import_csv(self, *args, **kwargs):
+        return await self._executer(self.db.import_csv, *args, **kwargs)
+
+    async def import_jsonl(self, *args, **kwargs):
+        return await self._executer(self.db.import_jsonl, *args, **kwargs)
+
+    async def export_csv(self, *args, **kwargs):
+        return await self._executer(self.db.export_csv, *args, **kwargs)
+
+    async def export_jsonl(self, *args, **kwargs):
+        return await self._executer(self.db.export_jsonl, *args, **kwargs)
+
+    async def select(self, *args, **kwargs):
+        return await self._executer(self.db.select, *args, **kwargs)
+
+    async def select_where(self, *args, **kwargs):
+        return await self._executer(self.db.select_where, *args, **kwargs)
+
+    async def select_colonnes(self, *args, **kwargs):
+        return await self._executer(self.db.select_colonnes, *args, **kwargs)
+
+    async def page(self, *args, **kwargs):
+        return await self._executer(self.db.page, *args, **kwargs)
+
+    async def update(self, *args, **kwargs):
+        return await self._executer(self.db.update, *args, **kwargs)
+
+    async def delete(self, *args, **kwargs):
+        return await self._executer(self.db.delete, *args, **kwargs)
+
+    async def DeleteTable(self, *args, **kwargs):
+        return await self._executer(self.db.DeleteTable, *args, **kwargs)
+
+    async def parametres_actifs(self):
+        return await self._executer(self.db.parametres_actifs)
+
+    def stats_cache(self) -> dict:
+        return self.db.stats_cache()
+
+    def vider_cache(self):
+        self.db.vider_cache()
+
+    async def select_iter(self, *args, taille_lot: int = 500, **kwargs):
+        """Version asynchrone de select_iter : async for ligne in adb.select_iter(...)"""
+        lignes = self.db.select_iter(*args, taille_lot=taille_lot, **kwargs)
+        async for ligne in self._iterer(lignes, taille_lot):
+            yield ligne
+
+    async def select_where_iter(self, *args, taille_lot: int = 500, **kwargs):
+        """Version asynchrone de select_where_iter."""
+        lignes = self.db.select_where_iter(*args, taille_lot=taille_lot, **kwargs)
+        async for ligne in self._iterer(lignes, taille_lot):
+            yield ligne
+
+    async def _iterer(self, lignes, taille_lot: int):
+        # Chaque lot est lu dans un thread du pool ; le générateur synchrone
+        # garde sa connexion jusqu'à sa fermeture.
+        import asyncio
+
+        en_cours = None
+        try:
+            while True:
+                async with self._file_attente():
+                    en_cours = self._executeur.submit(
+                        lambda: list(islice(lignes, taille_lot))
+                    )
+                    lot = await asyncio.wrap_future(en_cours)
+                if not lot:
+                    break
+                for ligne in lot:
+                    yield ligne
+        finally:
+            if en_cours is not None and not en_cours.done():
+                # Annulé pendant la lecture d'un lot : le générateur tourne
+                # encore dans le thread, il sera fermé dès la fin du lot
+                en_cours.add_done_callback(lambda _: lignes.close())
+            else:
+                lignes.close()
+
+
+def safe_where_date(col: str, op: str, valeur: str) -> dict:
+    """
+    Génère une condition sécurisée pour Database.select_where.
+    La valeur est liée en paramètre (?), jamais insérée dans le SQL.
+    Exemple :
+        safe_where_date("date", ">=", "2025-05-22")
+        ➜ {"date": (">=", "2025-05-22")}
+    """
+    return {col: (op, valeur)}
@@ -0,0 +1,91 @@
+"""
+Nombres à la française : formatage (1 234,56 €) et conversion texte ➜ float.
+"""
+
+from typing import Union
+
+
+def nombreFr(valeur: Union[str, float, int], style: str = "float") -> str:
+    """
+    Formatte un nombre à la française :
+    - style="euro"  ➜ 12 345,67 €
+    - style="float" ➜ 12 345,67
+    - style="int"   ➜ 12 346
+    """
+    if isinstance(valeur, str):
+        try:
+            valeur = float(valeur.replace(",", ".").replace(" ", ""))
+        except:
+            return "—"
+
+    if style == "int":
+        entier = round(valeur)
+        partie = f"{entier:,}".replace(",", " ").replace("\xa0", " ")
+        return partie
+
+    partie = f"{valeur:,.2f}".replace(",", " ").replace(".", ",")
+    if style == "euro":
+        return partie + " €"
+    return partie
+
+
+def frToNombre(txt: str) -> float:
+    """
+    Convertit un texte formaté à la française en float :
+    - "12 345,67 €" ➜ 12345.67
+    - Gère tous les types d'espaces et formats typographiques
+    """
+    if not txt:
+        return 0.0
+    try:
+        propre = (
+            txt.replace("€", "")
+            .replace(",", ".")
+            .replace("\xa0", "")  # espace insécable classique
+            .replace("\u202f", "")  # espace fine insécable (française)
+            .replace(" ", "")
+        )
+        return float(propre)
+    except:
+        return 0.0
+
+
+def format_euro(valeur: Union[str, float, int]) -> str:
+    """
+    Formate une valeur en euros à la française.
+
+    - Accepte une chaîne, un entier ou un float (même formatée '1 000,50').
+    - Retourne une chaîne comme '1 234,56 €'.
+    - Retourne '0,00 €' si la conversion échoue.
+    """
+    try:
+        return f"{textoFloat(valeur):,.2f} €".replace(",", " ").replace(".", ",")
+    except:
+        return "0,00 €"
+
+
+def format_fr(nombre: Union[str, float, int]) -> str:
+    """
+    Formate un nombre en style français avec espaces pour les milliers et virgule pour les décimales.
+
+    - Exemple : 1234567.89 devient '1 234 567,89'
+    - Retourne '0,00' si la conversion échoue.
+    """
+    try:
+        return f"{float(nombre):,.2f}".replace(",", " ").replace(".", ",")
+    except:
+        return "0,00"
+
+
+def textoFloat(texte: Union[str, float, int]) -> float:
+    """
+    Convertit une chaîne, un entier ou un float vers un float.
+
+    - Accepte les formats comme '1 000,50' ou '1 000'.
+    - Utilise '.' comme séparateur décimal et ignore les espaces.
+    - Retourne 0.0 si la conversion échoue.
+    """
+    try:
+        return float(str(texte).replace(",", ".").replace(" ", ""))
+    except:
+        return 0.0
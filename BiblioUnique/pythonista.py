@@ -0,0 +1,112 @@
+"""
+Interfaces Pythonista (modules ui et dialogs, importés dans chaque fonction).
+"""
+
+from .dates import dateFr
+
+
+def dateSelectorAttach(datepicker, default_date):
+    """
+    Installe un DatePicker masqué + bouton cliquable.
+    - Le bouton affiche la date au format français.
+    - À la sélection, le bouton est mis à jour et le DatePicker disparaît.
+    - Si `state` est fourni, la valeur est enregistrée dans state[bind_key].
+    """
+
+    import ui
+    from datetime import datetime
+
+    def show_picker(sender):
+        datepicker.hidden = False
+        datepicker.bring_to_front()
+        print(f"show_picker {datepicker.name}")
+
+        # Créer un bouton de validation
+        if not hasattr(datepicker, "valider_button"):
+            valider = ui.Button()
+            valider.title = "✓"
+            valider.font = ("<system>", 20)
+            valider.alignment = ui.ALIGN_CENTER
+            valider.background_color = "#4CAF50"
+            valider.tint_color = "white"
+            valider.border_width = 1
+            valider.border_color = "#388E3C"
+            valider.corner_radius = 5
+            valider.action = lambda s: update_label(datepicker)
+            datepicker.valider_button = valider
+            datepicker.superview.add_subview(valider)
+
+        # Positionner le bouton de validation
+        picker_frame = datepicker.frame
+        valider = datepicker.valider_button
+        valider.frame = (
+            picker_frame[0] + picker_frame[2] + 10,
+            picker_frame[1],
+            40,
+            picker_frame[3],
+        )
+        valider.bring_to_front()
+
+    def update_label(sender):
+        # Mettre à jour le bouton avec la nouvelle date
+        button.title = dateFr(sender.date)
+        button.bring_to_front()
+        print(f"update_label {button.title}")
+
+        # Masquer le DatePicker
+        datepicker.hidden = True
+        print(f"Masquer le DatePicker {datepicker.name}")
+
+        # Masquer le bouton de validation
+        if hasattr(datepicker, "valider_button"):
+            datepicker.valider_button.hidden = True
+
+    # Préparation du DatePicker
+    datepicker.hidden = True
+    datepicker.date = default_date
+
+    # Bouton simulant le label
+    button = ui.Button()
+
+    # Bouton simulant le label
+    button = ui.Button()
+    button.name = f"label_for_{datepicker.name}"
+    button.title = dateFr(default_date)
+    button.font = ("<system>", 16)
+    button.alignment = ui.ALIGN_CENTER
+    button.frame = datepicker.frame
+    button.background_color = "white"
+    button.tint_color = "black"
+    button.border_width = 0
+    button.action = show_picker
+
+    datepicker.label_button = button
+    datepicker.superview.add_subview(button)
+
+
+# Fonction utilitaire pour la confirmation qui utilise soit dialogs soit input
+# selon l'environnement
+def demander_confirmation(message):
+    """
+    Demande une confirmation à l'utilisateur.
+    exemple :
+        demander_confirmation("Voulez-vous vraiment supprimer ce jour ?")
+
+    Args:
+        message (str): Message à afficher
+
+    Returns:
+        bool: True si confirmation, False sinon
+    """
+    try:
+        import dialogs  # Spécifique à Pythonista
+    except ImportError:
+        dialogs = None  # Pour Python standard
+
+    if dialogs:
+        # Utiliser alert() avec un seul bouton OK
+        result = dialogs.alert(message, "Confirmation", "OK")
+        # Si l'utilisateur clique sur OK, retourne True, sinon False
+        return result == "OK"
+    else:
+        return input(f"{message} (O/N)").lower() == "o"
@@ -0,0 +1,298 @@
+"""
+Sauvegarde automatique des scripts (Historic/) et utilitaires système.
+"""
+
+import sys
+import threading
+
+# Historic/<projet>/ est un stockage adressé par contenu :
+#   objets/<2 premiers car.>/<sha256>  un fichier par contenu distinct
+#   instantanes/<horodatage>.json      manifeste {nom de fichier: empreinte, ...}
+# Chaque manifeste décrit l'état complet du projet (les fichiers non modifiés
+# sont repris du précédent) : un instantané ne coûte que quelques octets tant
+# que rien ne change, et un contenu n'est jamais écrit deux fois.
+
+# Dernier manifeste connu par dossier de projet : {dossier: (horodatage,
+# manifeste)}, relu seulement si un autre processus en a écrit un plus récent
+_MANIFESTES = {}
+_VERROU = threading.Lock()
+
+
+def _fichier_racine() -> str:
+    """Fichier du cadre le plus externe (le script lancé), sans inspect.stack()."""
+    cadre = sys._getframe(1)
+    while cadre.f_back is not None:
+        cadre = cadre.f_back
+    return cadre.f_code.co_filename
+
+
+def _empreinte(contenu: bytes) -> str:
+    import hashlib
+
+    return hashlib.sha256(contenu).hexdigest()
+
+
+def _chemin_objet(dossier_projet: str, empreinte: str) -> str:
+    import os
+
+    return os.path.join(dossier_projet, "objets", empreinte[:2], empreinte)
+
+
+def _ecrire_atomique(chemin: str, contenu: bytes):
+    import os
+
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+    temporaire = f"{chemin}.{os.getpid()}.tmp"
+    with open(temporaire, "wb") as f:
+        f.write(contenu)
+    os.replace(temporaire, chemin)
+
+
+def _noms_instantanes(dossier_projet: str) -> list:
+    """Horodatages des instantanés, du plus récent au plus ancien."""
+    import os
+
+    dossier = os.path.join(dossier_projet, "instantanes")
+    if not os.path.isdir(dossier):
+        return []
+    return sorted(
+        (f[:-5] for f in os.listdir(dossier) if f.endswith(".json")), reverse=True
+    )
+
+
+def _lire_manifeste(dossier_projet: str, horodatage: str) -> dict:
+    import json
+    import os
+
+    chemin = os.path.join(dossier_projet, "instantanes", f"{horodatage}.json")
+    with open(chemin, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dernier_manifeste(dossier_projet: str) -> dict:
+    # Un seul listdir par appel : le cache ne sert que si le plus récent
+    # instantané sur disque est encore celui qu'il contient
+    noms = _noms_instantanes(dossier_projet)
+    if not noms:
+        _MANIFESTES.pop(dossier_projet, None)
+        return {}
+    connu = _MANIFESTES.get(dossier_projet)
+    if connu is not None and connu[0] == noms[0]:
+        return connu[1]
+    manifeste = _lire_manifeste(dossier_projet, noms[0])
+    _MANIFESTES[dossier_projet] = (noms[0], manifeste)
+    return manifeste
+
+
+def _nettoyer_historique(dossier_projet: str, limite: int, log: bool):
+    """Garde les `limite` derniers manifestes puis supprime les objets orphelins."""
+    import os
+
+    try:
+        with _VERROU:
+            for ancien in _noms_instantanes(dossier_projet)[limite:]:
+                os.remove(os.path.join(dossier_projet, "instantanes", f"{ancien}.json"))
+            utilisees = set()
+            for nom in _noms_instantanes(dossier_projet):
+                fichiers = _lire_manifeste(dossier_projet, nom)["fichiers"]
+                utilisees.update(f["empreinte"] for f in fichiers.values())
+            dossier_objets = os.path.join(dossier_projet, "objets")
+            for racine, _, objets in os.walk(dossier_objets):
+                for objet in objets:
+                    if objet not in utilisees:
+                        os.remove(os.path.join(racine, objet))
+    except Exception as e:
+        if log:
+            print(f"❌ Erreur nettoyage sauvegardeAuto: {e}")
+
+
+def sauvegardeAuto(nameProject="auto", LOG_ACTIVE=True, NB_SAUVEGARDE=20):
+    """
+    Sauvegarde automatiquement le script appelant dans l'historique du projet.
+
+    📦 Fonctionnement :
+    - Range le contenu du fichier appelant dans Historic/<nomProjet>/objets/,
+      une seule fois par contenu distinct (empreinte SHA-256).
+    - Écrit un instantané Historic/<nomProjet>/instantanes/<horodatage>.json
+      listant les fichiers du projet, seulement si le fichier a changé.
+    - Garde uniquement les X derniers instantanés selon NB_SAUVEGARDE et
+      supprime les contenus qui ne servent plus (thread de fond).
+    - lister_sauvegardes() / restaurer_sauvegarde() pour relire l'historique.
+
+    🔧 Paramètres :
+    - nameProject (str) : Nom du projet (ou "auto" pour détecter automatiquement).
+    - LOG_ACTIVE (bool) : Affiche les messages de log dans le terminal.
+    - NB_SAUVEGARDE (int) : Nombre d'instantanés à conserver.
+
+    ✅ Compatible avec tous les fichiers appelant la fonction dans un projet commun.
+
+    ⚠️ N'est plus lancée à l'import de BiblioUnique : l'appeler explicitement
+    en tête du script à sauvegarder.
+        from BiblioUnique import sauvegardeAuto
+        sauvegardeAuto()
+    """
+    import os
+    import json
+    from datetime import datetime
+
+    _CONFIG_SAUVEGARDE = {
+        "initialized": False,
+        "nameProject": "",
+        "log": True,
+        "limit": 20,
+        "horodatage": datetime.now().strftime("%Y%m%d-%H%M%S"),
+    }
+    if not _CONFIG_SAUVEGARDE["initialized"]:
+        _CONFIG_SAUVEGARDE["nameProject"] = nameProject if nameProject else ""
+        _CONFIG_SAUVEGARDE["log"] = LOG_ACTIVE
+        _CONFIG_SAUVEGARDE["limit"] = NB_SAUVEGARDE
+        _CONFIG_SAUVEGARDE["initialized"] = True
+
+        if _CONFIG_SAUVEGARDE["nameProject"] == "auto":
+            _CONFIG_SAUVEGARDE["nameProject"] = os.path.basename(
+                _fichier_racine()
+            ).split(".")[0]
+
+    try:
+        # Cadre de l'appelant : lecture directe, sans charger le code source
+        caller_file = sys._getframe(1).f_code.co_filename
+        if not caller_file.endswith(".py"):
+            return
+
+        nom_fichier = os.path.basename(caller_file)
+        dossier_projet = os.path.join(
+            os.path.dirname(caller_file),
+            "Historic",
+            _CONFIG_SAUVEGARDE["nameProject"],
+        )
+        with open(caller_file, "rb") as f:
+            contenu = f.read()
+        empreinte = _empreinte(contenu)
+
+        with _VERROU:
+            precedent = _dernier_manifeste(dossier_projet)
+            fichiers = dict(precedent.get("fichiers", {}))
+            if fichiers.get(nom_fichier, {}).get("empreinte") == empreinte:
+                if _CONFIG_SAUVEGARDE["log"]:
+                    print(f"⏭️ Sauvegarde inutile, {nom_fichier} inchangé")
+                return
+
+            objet = _chemin_objet(dossier_projet, empreinte)
+            if not os.path.exists(objet):
+                _ecrire_atomique(objet, contenu)
+            fichiers[nom_fichier] = {
+                "empreinte": empreinte,
+                "taille": len(contenu),
+                "chemin": caller_file,
+            }
+            manifeste = {
+                "horodatage": _CONFIG_SAUVEGARDE["horodatage"],
+                "fichiers": fichiers,
+            }
+            _ecrire_atomique(
+                os.path.join(
+                    dossier_projet,
+                    "instantanes",
+                    f"{_CONFIG_SAUVEGARDE['horodatage']}.json",
+                ),
+                json.dumps(manifeste, indent=2, ensure_ascii=False).encode("utf-8"),
+            )
+            _MANIFESTES[dossier_projet] = (_CONFIG_SAUVEGARDE["horodatage"], manifeste)
+
+        if _CONFIG_SAUVEGARDE["log"]:
+            print(f"✅ Sauvegarde : {nom_fichier} ➜ {_CONFIG_SAUVEGARDE['horodatage']}")
+
+        # Nettoyage des anciens instantanés, sans faire attendre l'appelant
+        threading.Thread(
+            target=_nettoyer_historique,
+            args=(
+                dossier_projet,
+                _CONFIG_SAUVEGARDE["limit"],
+                _CONFIG_SAUVEGARDE["log"],
+            ),
+            name="sauvegardeAuto-nettoyage",
+            daemon=True,
+        ).start()
+
+    except Exception as e:
+        if _CONFIG_SAUVEGARDE["log"]:
+            print(f"❌ Erreur sauvegardeAuto: {e}")
+
+
+def lister_sauvegardes(nameProject: str, racine: str = ".") -> list:
+    """
+    Liste les instantanés de <racine>/Historic/<nameProject>, du plus récent
+    au plus ancien.
+    exemple : lister_sauvegardes("main")[0]["fichiers"]["main.py"]["empreinte"]
+
+    Returns:
+        list: [{"horodatage": "20250524-101500", "fichiers": {nom: {"empreinte",
+        "taille", "chemin"}}}, ...]
+    """
+    import os
+
+    dossier_projet = os.path.join(racine, "Historic", nameProject)
+    return [
+        _lire_manifeste(dossier_projet, nom)
+        for nom in _noms_instantanes(dossier_projet)
+    ]
+
+
+def restaurer_sauvegarde(
+    nameProject: str,
+    horodatage: str = None,
+    fichiers: list = None,
+    destination: str = None,
+    racine: str = ".",
+) -> list:
+    """
+    Restaure les fichiers d'un instantané (le plus récent par défaut).
+    exemple : restaurer_sauvegarde("main", "20250524-101500", ["main.py"], "restauration")
+
+    - fichiers : noms à restaurer (tous ceux de l'instantané par défaut)
+    - destination : dossier cible ; par défaut chaque fichier retrouve son
+      emplacement d'origine (le fichier actuel est alors écrasé)
+
+    Returns:
+        list: chemins des fichiers restaurés
+    """
+    import os
+
+    dossier_projet = os.path.join(racine, "Historic", nameProject)
+    noms = _noms_instantanes(dossier_projet)
+    if not noms:
+        raise FileNotFoundError(f"Aucune sauvegarde pour le projet {nameProject!r}")
+    if horodatage is None:
+        horodatage = noms[0]
+    elif horodatage not in noms:
+        raise FileNotFoundError(f"Instantané inconnu : {horodatage!r}")
+
+    contenus = _lire_manifeste(dossier_projet, horodatage)["fichiers"]
+    inconnus = set(fichiers or ()) - set(contenus)
+    if inconnus:
+        raise KeyError(f"Absents de l'instantané {horodatage} : {sorted(inconnus)}")
+
+    restaures = []
+    for nom in fichiers or sorted(contenus):
+        info = contenus[nom]
+        with open(_chemin_objet(dossier_projet, info["empreinte"]), "rb") as f:
+            contenu = f.read()
+        cible = (
+            os.path.join(destination, nom)
+            if destination is not None
+            else info["chemin"]
+        )
+        _ecrire_atomique(cible, contenu)
+        restaures.append(cible)
+    return restaures
+
+
+def raise_mac_app():
+    import os
+
+    script = f"""
+    tell application "System Events"
+        set frontmost of the first process whose unix id is {os.getpid()} to true
+    end tell
+    """
+    os.system(f"osascript -e '{script}'")
@@ -0,0 +1,280 @@
+"""
+Widgets et dialogues wxPython (wx est importé dans chaque fonction).
+"""
+
+from .dates import validate_and_fix_date
+
+
+def get_police_luciole(taille=14, gras=False):
+    import wx
+
+    poids = wx.FONTWEIGHT_BOLD if gras else wx.FONTWEIGHT_NORMAL
+    return wx.Font(
+        taille, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, poids, False, "Luciole"
+    )
+
+
+def wxSegControl(parent, options: list[str], orient="horizontal"):
+    """SegmentedControl exclusif, retour index (ou -1 si rien)
+
+    Args:
+        parent : wx.Panel ou wx.Frame parent
+        options : liste de libellés (str)
+        orient : "horizontal" ou "vertical"
+
+    Returns:
+        wx.Panel avec méthodes :
+            .get_selection() -> int
+            .set_selection(index: int)
+    """
+    import wx
+
+    class _SegmentedCheckBox(wx.Panel):
+        def __init__(self, parent, options, orient):
+            super().__init__(parent)
+
+            self.options = options
+            self.orientation = orient
+            self.box = wx.BoxSizer(
+                wx.HORIZONTAL if orient == "horizontal" else wx.VERTICAL
+            )
+            self.checkboxes = []
+
+            dc = wx.ClientDC(self)
+            font = self.GetFont()
+            dc.SetFont(font)
+            widths = [dc.GetTextExtent(opt)[0] for opt in options]
+            max_width = max(widths) + 20
+
+            for label in options:
+                cb = wx.CheckBox(self, label=label, size=(max_width, -1))
+                cb.Bind(wx.EVT_CHECKBOX, self._on_check)
+                self.box.Add(cb, 0, wx.ALL, 2)
+                self.checkboxes.append(cb)
+
+            self.SetSizer(self.box)
+
+        def _on_check(self, event):
+            clicked = event.GetEventObject()
+            if clicked.GetValue():
+                for cb in self.checkboxes:
+                    if cb != clicked:
+                        cb.SetValue(False)
+
+        def get_selection(self) -> int:
+            for i, cb in enumerate(self.checkboxes):
+                if cb.GetValue():
+                    return i
+            return -1
+
+        def set_selection(self, index: int):
+            for i, cb in enumerate(self.checkboxes):
+                cb.SetValue(i == index)
+
+        def reset_selection(self):
+            for cb in self.checkboxes:
+                cb.SetValue(False)
+
+    return _SegmentedCheckBox(parent, options, orient)
+
+
+def choixDateForPython(
+    question: str = "Date ?",
+    jourDebut: int | None = None,
+    moisDebut: int | None = None,
+    anneeDebut: int | None = None,
+):
+    """
+    Affiche un calendrier avec sélection jour/mois/année.
+
+    Parameters
+    ----------
+    question : str
+        Texte affiché en haut de la boîte de dialogue, ou None pour "Date ?".
+    jourDebut : int, optional
+        Jour à pré-sélectionner (1–31), ou None pour utiliser la date courante.
+    moisDebut : int, optional
+        Mois à pré-sélectionner (1–12), ou None pour utiliser la date courante.
+    anneeDebut : int, optional
+        Année à pré-sélectionner (≥1900), ou None pour utiliser la date courante.
+
+    Returns
+    -------
+    tuple
+        (True, date) si l'utilisateur valide une date,
+        (False, date_initiale) si l'utilisateur annule la sélection.
+    """
+
+    try:
+        import wx
+        from datetime import date
+        from calendar import monthrange
+    except ImportError:
+        raise RuntimeError("wxPython est requis dans l’environnement actuel.")
+
+    jourDebut, moisDebut, anneeDebut = validate_and_fix_date(
+        jourDebut, moisDebut, anneeDebut
+    )
+    ancienne_date = (jourDebut, moisDebut, anneeDebut)
+
+    dialog = wx.Dialog(None, title="Choisir une date")
+    sizer = wx.BoxSizer(wx.VERTICAL)
+    sizer.Add(wx.StaticText(dialog, label=question), 0, wx.ALL | wx.CENTER, 10)
+
+    mois_labels = [
+        "Jan",
+        "Fév",
+        "Mar",
+        "Avr",
+        "Mai",
+        "Juin",
+        "Juil",
+        "Aoû",
+        "Sep",
+        "Oct",
+        "Nov",
+        "Déc",
+    ]
+    month_choice = wx.Choice(dialog, choices=mois_labels)
+    month_choice.SetSelection(moisDebut - 1)
+
+    year_text = wx.TextCtrl(
+        dialog, value=str(anneeDebut), style=wx.TE_READONLY, size=(60, -1)
+    )
+
+    def popup_annee(evt=None):
+        dlg = wx.TextEntryDialog(
+            dialog, "Entrer une année", "Choisir une année", year_text.GetValue()
+        )
+        if dlg.ShowModal() == wx.ID_OK:
+            try:
+                an = int(dlg.GetValue())
+                if 1900 <= an <= 2100:
+                    year_text.SetValue(str(an))
+                    update_days()
+            except:
+                pass
+        dlg.Destroy()
+
+    year_text.Bind(wx.EVT_LEFT_DOWN, popup_annee)
+    year_text.Bind(wx.EVT_KILL_FOCUS, popup_annee)
+
+    ligne_haut = wx.BoxSizer(wx.HORIZONTAL)
+    ligne_haut.Add(month_choice, 1, wx.ALL, 5)
+    ligne_haut.Add(year_text, 0, wx.ALL, 5)
+    sizer.Add(ligne_haut, 0, wx.CENTER)
+
+    jours = ["Lu", "Ma", "Me", "Je", "Ve", "Sa", "Di"]
+    ligne_jours = wx.BoxSizer(wx.HORIZONTAL)
+    for j in jours:
+        b = wx.Button(dialog, label=j, size=(40, 30))
+        b.Disable()
+        ligne_jours.Add(b, 0, wx.ALL, 1)
+    sizer.Add(ligne_jours, 0, wx.CENTER)
+
+    panel = wx.Panel(dialog)
+    grille = wx.GridSizer(6, 7, 2, 2)
+    panel.SetSizer(grille)
+    sizer.Add(panel, 0, wx.ALL | wx.CENTER, 5)
+
+    resume = wx.StaticText(dialog, label="")
+    sizer.Add(resume, 0, wx.ALL | wx.CENTER, 5)
+
+    selected_day = [jourDebut]
+    boutons = []
+
+    def update_resume():
+        try:
+            dt = date(
+                int(year_text.GetValue()),
+                month_choice.GetSelection() + 1,
+                selected_day[0],
+            )
+            resume.SetLabel(dt.strftime("%A %d %B %Y").capitalize())
+        except:
+            resume.SetLabel("")
+
+    def update_days():
+        for b in boutons:
+            b.Destroy()
+        boutons.clear()
+        year = int(year_text.GetValue())
+        month = month_choice.GetSelection() + 1
+        start, count = monthrange(year, month)
+        decalage = (start + 6) % 7
+        for _ in range(decalage):
+            grille.Add(wx.StaticText(panel, label=""))
+        for d in range(1, count + 1):
+            b = wx.Button(panel, label=str(d), size=(40, 30))
+
+            def on_click(evt, j=d):
+                selected_day[0] = j
+                update_resume()
+
+            b.Bind(wx.EVT_BUTTON, on_click)
+            boutons.append(b)
+            grille.Add(b, 0, wx.EXPAND)
+        dialog.Layout()
+
+    month_choice.Bind(wx.EVT_CHOICE, lambda e: update_days())
+    update_days()
+
+    boutons_bas = wx.StdDialogButtonSizer()
+    ok = wx.Button(dialog, wx.ID_OK)
+    cancel = wx.Button(dialog, wx.ID_CANCEL)
+    boutons_bas.AddButton(ok)
+    boutons_bas.AddButton(cancel)
+    boutons_bas.Realize()
+    sizer.Add(boutons_bas, 0, wx.ALL | wx.EXPAND, 10)
+
+    dialog.SetSizer(sizer)
+    sizer.Fit(dialog)
+    dialog.Centre()
+
+    resultat = dialog.ShowModal()
+    dialog.Destroy()
+
+    if resultat == wx.ID_OK:
+        return (
+            True,
+            date(
+                int(year_text.GetValue()),
+                month_choice.GetSelection() + 1,
+                selected_day[0],
+            ),
+        )
+    else:
+        return (
+            False,
+            date(ancienne_date[2], ancienne_date[1], ancienne_date[0]),
+        )
+
+
+def wx_to_datetime(wx_date):
+    """
+    Convertit un objet wx.DateTime en objet datetime.datetime standard.
+
+    ⚠ wx.DateTime utilise un index de mois de 0 à 11 (Janvier = 0),
+    contrairement à datetime qui attend 1 à 12. Le mois est donc ajusté avec +1.
+
+    :param wx_date: Objet wx.DateTime (ex. issu d'un DatePickerCtrl)
+    :return: Objet datetime.datetime équivalent
+    """
+    from datetime import datetime
+    import wx  # import local pour ne pas alourdir globalement
+
+    return datetime(wx_date.GetYear(), wx_date.GetMonth() + 1, wx_date.GetDay())
+
+
+def datetime_to_wx(dt_obj):
+    """
+    Convertit un objet datetime.datetime standard en wx.DateTime.
+
+    ⚠ wx.DateTime attend un mois de 0 à 11, donc on enlève 1 à datetime.month.
+
+    :param dt_obj: Objet datetime.datetime
+    :return: Objet wx.DateTime équivalent
+    """
+    import wx  # import local pour garder la légèreté de la lib
+
+    return wx.DateTime.FromDMY(dt_obj.day, dt_obj.month - 1, dt_obj.year)
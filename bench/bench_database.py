@@ -0,0 +1,191 @@
+"""
+Banc d'essai de Database (lowORM) sur une base SQLite temporaire.
+
+Mesure, pour chaque taille de table et chaque nombre de threads, le débit
+(ops/s) et les latences p50 / p99 de insert, select, select_where, update
+et delete, puis écrit le résultat en JSON pour comparer deux versions.
+
+Usage :
+    python bench/bench_database.py
+    python bench/bench_database.py --lignes 1000 1000000 --threads 1 8 --sortie v2.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BiblioUnique import Database  # noqa: E402
+
+OPERATIONS = ("insert", "select", "select_where", "update", "delete")
+
+
+def preparer_base(chemin: str, nb_lignes: int, options: dict) -> Database:
+    bd = Database(chemin, **options)
+    bd.creer_table(
+        "bench",
+        {"id": "integer primary key", "nom": "text", "valeur": "integer"},
+    )
+    bd.insert_many(
+        "bench",
+        ({"nom": f"nom{i}", "valeur": i % 1000} for i in range(nb_lignes)),
+        taille_lot=10000,
+    )
+    verifier_lectures(bd, nb_lignes)
+    return bd
+
+
+def verifier_lectures(bd: Database, nb_lignes: int):
+    """
+    Contrôle avant mesure : des valeurs différentes, liées par position ou
+    par nom (:id), doivent rendre des lignes différentes, cache actif ou non.
+    """
+    if nb_lignes < 2:
+        return
+    for _ in range(2):  # le 2e passage relit depuis le cache s'il est actif
+        for where, params in (
+            ("id = ?", ((1,), (2,))),
+            ("id = :id", ({"id": 1}, {"id": 2})),
+        ):
+            lignes = [bd.select("bench", ["id"], where, p) for p in params]
+            if lignes != [[(1,)], [(2,)]]:
+                raise RuntimeError(
+                    f"Lecture incohérente pour {where!r} : {lignes} au lieu de [[(1,)], [(2,)]]"
+                )
+
+
+def operation(bd: Database, nom: str, nb_lignes: int, rng: random.Random):
+    """Retourne une fonction sans argument qui exécute une opération `nom`."""
+    if nom == "insert":
+        return lambda: bd.insert("bench", {"nom": "nouveau", "valeur": 1})
+    if nom == "select":
+        return lambda: bd.select(
+            "bench", where="id = ?", params=(rng.randint(1, nb_lignes),)
+        )
+    if nom == "select_where":
+        return lambda: bd.select_where(
+            "bench", [("id", ">=", rng.randint(1, nb_lignes))], "id", 10
+        )
+    if nom == "update":
+        return lambda: bd.update(
+            "bench",
+            {"valeur": rng.randint(0, 999)},
+            "id = ?",
+            (rng.randint(1, nb_lignes),),
+        )
+    if nom == "delete":
+        return lambda: bd.delete("bench", "id = ?", (rng.randint(1, nb_lignes),))
+    raise ValueError(nom)
+
+
+def mesurer(bd, nom, nb_lignes, nb_operations, nb_threads, graine) -> dict:
+    latences = []
+    verrou = threading.Lock()
+    par_thread = max(1, nb_operations // nb_threads)
+
+    def travailleur(indice):
+        executer = operation(bd, nom, nb_lignes, random.Random(graine + indice))
+        locales = []
+        for _ in range(par_thread):
+            debut = time.perf_counter_ns()
+            executer()
+            locales.append(time.perf_counter_ns() - debut)
+        with verrou:
+            latences.extend(locales)
+
+    threads = [
+        threading.Thread(target=travailleur, args=(i,)) for i in range(nb_threads)
+    ]
+    debut = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    duree = time.perf_counter() - debut
+
+    latences.sort()
+    return {
+        "operation": nom,
+        "lignes": nb_lignes,
+        "threads": nb_threads,
+        "operations": len(latences),
+        "ops_par_seconde": len(latences) / duree,
+        "p50_ms": latences[len(latences) // 2] / 1e6,
+        "p99_ms": latences[min(len(latences) - 1, int(len(latences) * 0.99))] / 1e6,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--lignes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000]
+    )
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    parser.add_argument(
+        "--operations", type=int, default=2000, help="opérations mesurées par cas"
+    )
+    parser.add_argument("--profil", default="concurrent")
+    parser.add_argument("--taille-pool", type=int, default=8)
+    parser.add_argument("--ecriture-groupee", action="store_true")
+    parser.add_argument(
+        "--cache-resultats", type=int, default=0, help="taille du cache de résultats"
+    )
+    parser.add_argument("--graine", type=int, default=1234)
+    parser.add_argument("--sortie", default="bench_database.json")
+    args = parser.parse_args(argv)
+
+    options = {
+        "profil": args.profil,
+        "taille_pool": args.taille_pool,
+        "ecriture_groupee": args.ecriture_groupee,
+        "cache_resultats": args.cache_resultats,
+    }
+    resultats = []
+    print(
+        f"{'opération':<13}{'lignes':>9}{'threads':>8}{'ops/s':>11}{'p50 ms':>9}{'p99 ms':>9}"
+    )
+    for nb_lignes in args.lignes:
+        for nb_threads in args.threads:
+            with tempfile.TemporaryDirectory() as dossier:
+                bd = preparer_base(
+                    os.path.join(dossier, "bench.db"), nb_lignes, options
+                )
+                try:
+                    for nom in OPERATIONS:
+                        r = mesurer(
+                            bd, nom, nb_lignes, args.operations, nb_threads, args.graine
+                        )
+                        resultats.append(r)
+                        print(
+                            f"{nom:<13}{nb_lignes:>9}{nb_threads:>8}"
+                            f"{r['ops_par_seconde']:>11.0f}{r['p50_ms']:>9.3f}{r['p99_ms']:>9.3f}"
+                        )
+                finally:
+                    bd.fermer()
+
+    rapport = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "plateforme": platform.platform(),
+            "options": vars(args),
+        },
+        "resultats": resultats,
+    }
+    with open(args.sortie, "w", encoding="utf-8") as f:
+        json.dump(rapport, f, indent=2, ensure_ascii=False)
+    print(f"Résultats écrits dans {args.sortie}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Micro-banc d'essai du décorateur ensure_date.
+
+Compare, pour une même petite fonction de dates, le coût par appel :
+- sans décorateur (référence) ;
+- avec l'ancien ensure_date récursif (recopié ci-dessous) ;
+- avec ensure_date actuel (paramètres annotés date) ;
+en appelant avec des date (chemin rapide) puis avec des datetime (conversion).
+Le surcoût affiché est la différence avec la référence, en nanosecondes.
+
+Usage :
+    python bench/bench_ensure_date.py
+    python bench/bench_ensure_date.py --appels 1000000 --repetitions 7
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import date, datetime
+from functools import wraps
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BiblioUnique import ensure_date  # noqa: E402
+
+
+def ensure_date_recursif(func):
+    """Version précédente d'ensure_date, gardée comme point de comparaison."""
+
+    def convertir(obj):
+        if isinstance(obj, datetime):
+            return obj.date()
+        elif isinstance(obj, (list, tuple)):
+            return type(obj)(convertir(x) for x in obj)
+        elif isinstance(obj, dict):
+            return {k: convertir(v) for k, v in obj.items()}
+        else:
+            return obj
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        new_args = tuple(convertir(arg) for arg in args)
+        new_kwargs = {k: convertir(v) for k, v in kwargs.items()}
+        return func(*new_args, **new_kwargs)
+
+    return wrapper
+
+
+def ecart(date1: date, date2: date, style: str = "jours") -> int:
+    return (date2 - date1).days
+
+
+VARIANTES = {
+    "sans décorateur": ecart,
+    "ensure_date récursif": ensure_date_recursif(ecart),
+    "ensure_date": ensure_date(ecart),
+}
+
+ARGUMENTS = {
+    "date": ((date(2025, 1, 1), date(2025, 5, 24)), {"style": "jours"}),
+    "datetime": ((datetime(2025, 1, 1, 8), datetime(2025, 5, 24, 18)), {}),
+}
+
+
+def mesurer(fonction, args, kwargs, appels: int, repetitions: int) -> float:
+    """Meilleur temps par appel, en nanosecondes."""
+    minuterie = timeit.Timer(lambda: fonction(*args, **kwargs))
+    return min(minuterie.repeat(repetitions, appels)) / appels * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--appels", type=int, default=200000)
+    parser.add_argument("--repetitions", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'variante':<22}{'arguments':>10}{'ns/appel':>11}{'surcoût ns':>12}")
+    for type_args, (positionnels, nommes) in ARGUMENTS.items():
+        reference = None
+        for nom, fonction in VARIANTES.items():
+            duree = mesurer(
+                fonction, positionnels, nommes, args.appels, args.repetitions
+            )
+            if reference is None:
+                reference = duree
+            print(f"{nom:<22}{type_args:>10}{duree:>11.0f}{duree - reference:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
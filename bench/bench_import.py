@@ -0,0 +1,107 @@
+"""
+Budget de temps d'import de BiblioUnique.
+
+Exécute `from BiblioUnique import Database` (le besoin d'un worker Streamlit)
+dans des interpréteurs neufs, depuis un dossier temporaire, et échoue (code
+de sortie 1) si :
+- le temps d'import médian dépasse --budget-ms ;
+- l'import crée un fichier ou un dossier (ex. Historic/ de sauvegardeAuto) ;
+- l'import charge un module réservé à une fonction précise (asyncio, inspect,
+  random, PIL, wx, streamlit, pandas, numpy...) ou un sous-module de
+  BiblioUnique inutile à Database (wxui, pythonista, calendrier...).
+
+Usage :
+    python bench/bench_import.py
+    python bench/bench_import.py --essais 20 --budget-ms 60
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES_INTERDITS = (
+    "asyncio",
+    "inspect",
+    "random",
+    "shutil",
+    "PIL",
+    "wx",
+    "ui",
+    "streamlit",
+    "pandas",
+    "numpy",
+    "pyarrow",
+    "BiblioUnique.wxui",
+    "BiblioUnique.pythonista",
+    "BiblioUnique.calendrier",
+    "BiblioUnique.sysSauvegarde",
+    "BiblioUnique.etat",
+    "BiblioUnique.feries",
+)
+
+SCRIPT = f"""
+import json, sys, time
+sys.path.insert(0, {RACINE!r})
+debut = time.perf_counter()
+from BiblioUnique import Database
+duree = time.perf_counter() - debut
+charges = [m for m in {MODULES_INTERDITS!r} if m in sys.modules]
+print(json.dumps([duree * 1000, charges]))
+"""
+
+
+def mesurer_import(dossier: str) -> tuple:
+    """Retourne (durée d'import en ms, modules interdits chargés)."""
+    resultat = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=dossier,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    duree, charges = json.loads(resultat.stdout.strip().splitlines()[-1])
+    return duree, charges
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--essais", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=80.0)
+    args = parser.parse_args(argv)
+
+    erreurs = []
+    with tempfile.TemporaryDirectory() as dossier:
+        # Un premier import à blanc pour que le .pyc soit à jour
+        mesurer_import(dossier)
+        mesures = []
+        for _ in range(args.essais):
+            duree, charges = mesurer_import(dossier)
+            mesures.append(duree)
+        if charges:
+            erreurs.append(f"modules chargés à l'import : {', '.join(charges)}")
+        crees = os.listdir(dossier)
+        if crees:
+            erreurs.append(f"fichiers créés à l'import : {', '.join(crees)}")
+
+    mediane = statistics.median(mesures)
+    print(
+        f"from BiblioUnique import Database : médiane {mediane:.1f} ms, "
+        f"min {min(mesures):.1f} ms, max {max(mesures):.1f} ms "
+        f"(budget {args.budget_ms:.0f} ms, {args.essais} essais)"
+    )
+    if mediane > args.budget_ms:
+        erreurs.append(f"budget dépassé : {mediane:.1f} ms > {args.budget_ms:.0f} ms")
+
+    for erreur in erreurs:
+        print(f"❌ {erreur}")
+    return 1 if erreurs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,19 @@
 import streamlit as st
-from BiblioUnique import Database
+from BiblioUnique import Database, PuitsMemoire, panneau_requetes_lentes
 
-bd = Database("data.db")
+
+@st.cache_resource
+def ouvrir_base():
+    # Une seule instance (et donc un seul pool de connexions) pour tous les reruns
+    bd = Database(
+        "data.db", profil="concurrent", cache_resultats=64, ecriture_groupee=True
+    )
+    journal = PuitsMemoire(500)
+    bd.instrumenter(journal, seuil_lent=0.05)
+    return bd, journal
+
+
+bd, journal = ouvrir_base()
 bd.creer_table("users", {"id": "integer primary key", "nom": "text", "age": "integer"})
 
 st.title("App Streamlit + SQLite")
@@ -15,6 +27,19 @@ if st.button("Ajouter"):
     st.success("Utilisateur ajouté avec succès")
 
 st.write("Liste des utilisateurs")
-users = bd.select("users")
-for user in users:
-    st.write(user)
+if "curseur_users" not in st.session_state:
+    st.session_state.curseur_users = None
+
+page = bd.page("users", taille=50, curseur=st.session_state.curseur_users)
+st.dataframe([dict(zip(page.colonnes, ligne)) for ligne in page.lignes])
+
+col_precedent, col_suivant = st.columns(2)
+if col_precedent.button("◀ Précédent", disabled=page.precedent is None):
+    st.session_state.curseur_users = page.precedent
+    st.rerun()
+if col_suivant.button("Suivant ▶", disabled=page.suivant is None):
+    st.session_state.curseur_users = page.suivant
+    st.rerun()
+
+with st.sidebar.expander("Requêtes les plus lentes"):
+    panneau_requetes_lentes(journal, n=10)